@@ -5,6 +5,7 @@ Revises: 9d21d80181d1
 Create Date: 2026-01-07 18:17:27.665551
 
 """
+import os
 from typing import Sequence, Union
 
 from alembic import op
@@ -17,6 +18,9 @@ down_revision: Union[str, Sequence[str], None] = '9d21d80181d1'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Rows updated per executemany batch, bounding the parameter list size.
+BATCH_SIZE = int(os.environ.get("MIGRATION_BATCH_SIZE", "5000"))
+
 
 def upgrade() -> None:
     """Upgrade schema."""
@@ -24,25 +28,23 @@ def upgrade() -> None:
     op.add_column("user_profile", sa.Column("first_name", sa.String(), nullable=True))
     op.add_column("user_profile", sa.Column("last_name", sa.String(), nullable=True))
 
-    # Migrate data: try to split full_name into first_name and last_name
+    # Migrate data: split full_name into first_name and last_name in Python.
+    # str.partition is a single C-level scan per name (vs interpreted
+    # instr/substr calls per row in SQLite), and the updates go through
+    # bounded executemany batches inside the migration's own transaction.
     connection = op.get_bind()
-    connection.execute(
-        sa.text(
-            """
-            UPDATE user_profile 
-            SET 
-                first_name = CASE 
-                    WHEN full_name LIKE '% %' THEN substr(full_name, 1, instr(full_name, ' ') - 1)
-                    ELSE full_name 
-                END,
-                last_name = CASE 
-                    WHEN full_name LIKE '% %' THEN substr(full_name, instr(full_name, ' ') + 1)
-                    ELSE NULL 
-                END
-            WHERE full_name IS NOT NULL
-        """
-        )
-    )
+    rows = connection.execute(
+        sa.text("SELECT id, full_name FROM user_profile WHERE full_name IS NOT NULL")
+    ).fetchall()
+
+    params = []
+    for row_id, full_name in rows:
+        first_name, _, last_name = full_name.partition(" ")
+        params.append({"id": row_id, "first": first_name, "last": last_name or None})
+
+    update_stmt = sa.text("UPDATE user_profile SET first_name = :first, last_name = :last WHERE id = :id")
+    for start in range(0, len(params), BATCH_SIZE):
+        connection.execute(update_stmt, params[start : start + BATCH_SIZE])
 
     # Drop old column
     op.drop_column("user_profile", "full_name")
@@ -0,0 +1,34 @@
+"""add generation_history created_at index
+
+Revision ID: e3b1c7f2a9d4
+Revises: 648a37df3428
+Create Date: 2026-08-26 09:12:41.118264
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3b1c7f2a9d4'
+down_revision: Union[str, Sequence[str], None] = '648a37df3428'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The history listing orders by created_at DESC LIMIT N; an index matching
+    # the sort turns the full-table sort into an ordered index scan.
+    op.create_index(
+        'ix_generation_history_created_at',
+        'generation_history',
+        [sa.text('created_at DESC'), 'id'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_generation_history_created_at', table_name='generation_history')
@@ -1,11 +1,15 @@
 """API routes for AI chat."""
 
+import asyncio
 import logging
+from functools import lru_cache
+from pathlib import Path
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from pydantic import BaseModel
 from pydantic_ai import Agent
+from pydantic_ai.models import Model
 from pydantic_ai.ui import StateDeps
 from pydantic_ai.ui.ag_ui import AGUIAdapter
 from sqlalchemy import select
@@ -22,6 +26,16 @@ router = APIRouter(prefix="/chat", tags=["chat"])
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _cached_model(provider: str, model_name: str, api_key: str | None, base_url: str | None) -> Model:
+    """Build (and memoize) the pydantic-ai model for an LLM configuration.
+
+    Model construction sets up an HTTP client per provider, which is wasted
+    work when every chat turn uses the same active configuration.
+    """
+    return get_model(provider=provider, model_name=model_name, api_key=api_key, base_url=base_url)
+
+
 class JobPostingContext(BaseModel):
     """Context information about a job posting."""
 
@@ -64,48 +78,74 @@ def _build_instructions(state: ChatState, prompt_manager: PromptManager) -> str:
     return prompt_manager.render_prompt(PromptTemplate.CHAT_INSTRUCTIONS, context=context)
 
 
+def _read_file_if_exists(path: Path) -> str | None:
+    """Read a file's content, returning None if it does not exist."""
+    if path.exists():
+        return path.read_text(encoding="utf-8")
+    return None
+
+
 async def _load_state(db: AsyncSession, settings: Settings, body: dict) -> ChatState:
-    """Load state from request body."""
+    """Load state from request body.
+
+    The DB roundtrip and the (thread-offloaded) file reads run concurrently,
+    so total latency is bounded by the slowest load instead of their sum.
+    """
     state_data = body.get("state", {})
     chat_state = ChatState()
 
-    # Load job posting
-    job_posting_id = state_data.get("job_posting_id")
-    if job_posting_id:
-        stmt = select(JobPosting).where(JobPosting.id == job_posting_id)
+    async def _load_job_posting() -> None:
+        job_posting_id = state_data.get("job_posting_id")
+        if not job_posting_id:
+            return
+        # Project only the columns the chat context consumes instead of
+        # materializing a full ORM instance.
+        stmt = select(
+            JobPosting.id,
+            JobPosting.url,
+            JobPosting.description,
+            JobPosting.full_content,
+            JobPosting.generated_metadata,
+        ).where(JobPosting.id == job_posting_id)
         result = await db.execute(stmt)
-        posting = result.scalars().first()
-        if posting:
+        row = result.one_or_none()
+        if row:
+            metadata = row.generated_metadata
             chat_state.job_posting = JobPostingContext(
-                id=posting.id,
-                url=posting.url,
-                description=posting.description,
-                company_name=posting.generated_metadata.get("company_name") if posting.generated_metadata else None,
-                job_title=posting.generated_metadata.get("job_title") if posting.generated_metadata else None,
-                full_content=posting.full_content,
-                generated_metadata=posting.generated_metadata,
+                id=row.id,
+                url=row.url,
+                description=row.description,
+                company_name=metadata.get("company_name") if metadata else None,
+                job_title=metadata.get("job_title") if metadata else None,
+                full_content=row.full_content,
+                generated_metadata=metadata,
             )
 
-    # Load CV content
-    cv_file = state_data.get("cv_file")
-    if cv_file:
-        cv_path = settings.DATA_DIR / "cvs" / cv_file
-        if cv_path.exists():
-            chat_state.cv_content = cv_path.read_text(encoding="utf-8")
-
-    # Load cover letter content
-    cover_letter_file = state_data.get("cover_letter_file")
-    if cover_letter_file:
-        cl_path = settings.DATA_DIR / "cover_letters" / cover_letter_file
-        if cl_path.exists():
-            chat_state.cover_letter_content = cl_path.read_text(encoding="utf-8")
-
-    # Load personal information
-    personal_info_file = state_data.get("personal_info_file")
-    if personal_info_file:
-        pi_path = settings.DATA_DIR / "personal_information" / personal_info_file
-        if pi_path.exists():
-            chat_state.personal_info = pi_path.read_text(encoding="utf-8")
+    async def _load_cv_content() -> None:
+        cv_file = state_data.get("cv_file")
+        if cv_file:
+            chat_state.cv_content = await asyncio.to_thread(_read_file_if_exists, settings.DATA_DIR / "cvs" / cv_file)
+
+    async def _load_cover_letter_content() -> None:
+        cover_letter_file = state_data.get("cover_letter_file")
+        if cover_letter_file:
+            chat_state.cover_letter_content = await asyncio.to_thread(
+                _read_file_if_exists, settings.DATA_DIR / "cover_letters" / cover_letter_file
+            )
+
+    async def _load_personal_info() -> None:
+        personal_info_file = state_data.get("personal_info_file")
+        if personal_info_file:
+            chat_state.personal_info = await asyncio.to_thread(
+                _read_file_if_exists, settings.DATA_DIR / "personal_information" / personal_info_file
+            )
+
+    await asyncio.gather(
+        _load_job_posting(),
+        _load_cv_content(),
+        _load_cover_letter_content(),
+        _load_personal_info(),
+    )
 
     return chat_state
 
@@ -128,7 +168,7 @@ async def run_agent(db: Annotated[AsyncSession, Depends(get_db)], request: Reque
         prompt_manager=request.state.prompt_manager,
     )
 
-    model = get_model(
+    model = _cached_model(
         provider=active_llm_config.provider,
         model_name=active_llm_config.model_name,
         api_key=active_llm_config.api_key,
@@ -1,13 +1,17 @@
 """API routes for document generation."""
 
+import asyncio
 import logging
+import os
+import re
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.responses import FileResponse
-from sqlalchemy import select
+from sqlalchemy import delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from applique_backend.api.deps import get_db
@@ -26,19 +30,77 @@ from applique_backend.services.document_service import DocumentService, LaTeXCom
 router = APIRouter(prefix="/documents", tags=["documents"])
 logger = logging.getLogger(__name__)
 
+# Characters stripped from company names when building output filenames;
+# \w keeps unicode letters so non-ASCII names survive sanitization
+_SANITIZE_RE = re.compile(r"[^\w \-]")
+_SPACE_RE = re.compile(r"\s+")
+
+# file_type path parameter -> (_get_paths key, file extension). Single dispatch
+# table instead of repeated if/elif chains; doubles as the valid-type allowlist.
+_FILE_TYPE_MAP = {
+    "cv": ("cvs_dir", ".tex"),
+    "cover_letter": ("cover_letters_dir", ".tex"),
+    "attachment": ("attachments_dir", ".pdf"),
+    "personal_information": ("personal_info_dir", ".txt"),
+}
+
+# Posting metadata keys exposed as template variables during generation
+_VAR_KEYS = (
+    "company_name",
+    "job_title",
+    "recipient_name",
+    "city",
+    "zip_code",
+    "street_address",
+    "salary_range",
+    "job_description_summary",
+)
 
-def _get_paths(settings: Settings) -> dict[str, Path]:
-    """Get directory paths from settings."""
-    data_dir = settings.DATA_DIR
-    output_dir = settings.OUTPUT_DIR
+
+class PDFFileResponse(FileResponse):
+    """FileResponse streaming in larger chunks than Starlette's 64 KiB default.
+
+    Cuts the number of user-space iterations on multi-MB generated PDFs.
+    """
+
+    chunk_size = 256 * 1024
+
+
+def _list_suffix(directory: Path, suffix: str) -> list[str]:
+    """List file names with the given suffix in a directory, sorted.
+
+    Uses os.scandir directly so directory listing stays a flat string pass
+    without per-entry Path construction or extra stat calls.
+    """
+    try:
+        return sorted(entry.name for entry in os.scandir(directory) if entry.name.endswith(suffix) and entry.is_file())
+    except FileNotFoundError:
+        return []
+
+
+@lru_cache(maxsize=8)
+def _resolved(path: Path) -> Path:
+    """Resolve a Settings-derived directory once per process."""
+    return path.resolve()
+
+
+@lru_cache(maxsize=8)
+def _get_paths_for(data_dir: Path, output_dir: Path) -> dict[str, Path]:
+    """Build the derived directory paths once per (data_dir, output_dir) pair."""
     return {
         "cvs_dir": data_dir / "cvs",
         "cover_letters_dir": data_dir / "cover_letters",
         "attachments_dir": data_dir / "attachments",
+        "personal_info_dir": data_dir / "personal_information",
         "output_dir": output_dir,
     }
 
 
+def _get_paths(settings: Settings) -> dict[str, Path]:
+    """Get directory paths from settings (cached by the configured directories)."""
+    return _get_paths_for(settings.DATA_DIR, settings.OUTPUT_DIR)
+
+
 @router.get("/templates", response_model=DocumentTemplateResponse)
 async def get_templates(request: Request) -> DocumentTemplateResponse:
     """Get available document templates."""
@@ -48,16 +110,12 @@ async def get_templates(request: Request) -> DocumentTemplateResponse:
     cvs_dir = paths["cvs_dir"]
     cover_letters_dir = paths["cover_letters_dir"]
     attachments_dir = paths["attachments_dir"]
-    personal_info_dir = settings.DATA_DIR / "personal_information"
-
-    cv_files = sorted([f.name for f in cvs_dir.glob("*.tex")])
-    cover_letter_files = sorted([f.name for f in cover_letters_dir.glob("*.tex")])
+    personal_info_dir = paths["personal_info_dir"]
 
-    attachments_dir.mkdir(parents=True, exist_ok=True)
-    attachment_files = sorted([f.name for f in attachments_dir.glob("*.pdf")])
-
-    personal_info_dir.mkdir(parents=True, exist_ok=True)
-    personal_info_files = sorted([f.name for f in personal_info_dir.glob("*.txt")])
+    cv_files = _list_suffix(cvs_dir, ".tex")
+    cover_letter_files = _list_suffix(cover_letters_dir, ".tex")
+    attachment_files = _list_suffix(attachments_dir, ".pdf")
+    personal_info_files = _list_suffix(personal_info_dir, ".txt")
 
     return DocumentTemplateResponse(
         cvs=cv_files,
@@ -86,12 +144,13 @@ async def generate_documents(  # noqa: PLR0915
     if not data.cv_file and not data.cover_letter_file and not attachments:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="At least one document must be selected")
 
-    output_dir.mkdir(exist_ok=True, parents=True)
     generated_files = []
 
     # Prepare variables for replacement
     variables: dict[str, str] = {}
-    posting = None
+    metadata: dict | None = None
+    company_name: str | None = None
+    job_title: str | None = None
 
     if data.posting_id:
         # Fetch job posting data
@@ -100,35 +159,33 @@ async def generate_documents(  # noqa: PLR0915
         posting = result.scalars().first()
 
         if posting and posting.generated_metadata:
-            # Extract variables from metadata
+            # Extract variables from metadata once; the values are reused for
+            # the output filename and the history record below.
             metadata = posting.generated_metadata
-            variables = {
-                "company_name": metadata.get("company_name", ""),
-                "job_title": metadata.get("job_title", ""),
-                "recipient_name": metadata.get("recipient_name", ""),
-                "city": metadata.get("city", ""),
-                "zip_code": metadata.get("zip_code", ""),
-                "street_address": metadata.get("street_address", ""),
-                "salary_range": metadata.get("salary_range", ""),
-                "job_description_summary": metadata.get("job_description_summary", ""),
-            }
+            company_name = metadata.get("company_name")
+            job_title = metadata.get("job_title")
+            variables = {key: metadata.get(key, "") for key in _VAR_KEYS}
 
     # Add custom variables (override posting variables if provided)
     if data.custom_variables:
-        variables.update(data.custom_variables)
+        variables |= data.custom_variables
 
     try:
+        # Compile cover letter and CV concurrently - the pdflatex invocations
+        # are independent subprocesses and can run on separate cores.
+        compile_jobs: list[tuple[str, Path]] = []
         if data.cover_letter_file:
-            cl_pdf = await DocumentService.generate_pdf_from_latex(
-                cover_letters_dir / data.cover_letter_file, output_dir, variables
-            )
-            generated_files.append(cl_pdf)
-            logger.info("Generated cover letter: %s", cl_pdf)
-
+            compile_jobs.append(("cover letter", cover_letters_dir / data.cover_letter_file))
         if data.cv_file:
-            cv_pdf = await DocumentService.generate_pdf_from_latex(cvs_dir / data.cv_file, output_dir, variables)
-            generated_files.append(cv_pdf)
-            logger.info("Generated CV: %s", cv_pdf)
+            compile_jobs.append(("CV", cvs_dir / data.cv_file))
+
+        if compile_jobs:
+            compiled_pdfs = await DocumentService.generate_pdfs_batch(
+                [(tex_file, output_dir, variables) for _, tex_file in compile_jobs]
+            )
+            for (label, _), pdf_file in zip(compile_jobs, compiled_pdfs, strict=True):
+                generated_files.append(pdf_file)
+                logger.info("Generated %s: %s", label, pdf_file)
 
         for attachment in attachments:
             if attachment:
@@ -141,11 +198,11 @@ async def generate_documents(  # noqa: PLR0915
         if data.combine and len(generated_files) > 1:
             # Generate unique filename based on company name and timestamp
             timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
-            if posting and posting.generated_metadata:
-                company = posting.generated_metadata.get("company_name", "application")
+            if metadata:
+                company = company_name or "application"
                 # Sanitize company name for filename
-                company_safe = "".join(c for c in company if c.isalnum() or c in (" ", "-", "_")).strip()
-                company_safe = company_safe.replace(" ", "_")[:50]  # Limit length
+                company_safe = _SANITIZE_RE.sub("", company).strip()
+                company_safe = _SPACE_RE.sub("_", company_safe)[:50]  # Limit length
                 combined_pdf = output_dir / f"{company_safe}_application_{timestamp}.pdf"
             else:
                 combined_pdf = output_dir / f"combined_application_{timestamp}.pdf"
@@ -159,10 +216,8 @@ async def generate_documents(  # noqa: PLR0915
         # Save to generation history
         history = GenerationHistory(
             posting_id=data.posting_id,
-            company_name=posting.generated_metadata.get("company_name")
-            if posting and posting.generated_metadata
-            else None,
-            job_title=posting.generated_metadata.get("job_title") if posting and posting.generated_metadata else None,
+            company_name=company_name,
+            job_title=job_title,
             filename=result_file.name,
             cv_file=data.cv_file,
             cover_letter_file=data.cover_letter_file,
@@ -181,7 +236,7 @@ async def generate_documents(  # noqa: PLR0915
     except LaTeXCompilationError as e:
         logger.error("LaTeX compilation failed: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)) from e
-    except FileNotFoundError as e:
+    except (OSError, ValueError) as e:
         logger.error("File not found: %s", e)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
     except Exception as e:
@@ -196,10 +251,15 @@ async def download_document(request: Request, filename: str) -> FileResponse:
     output_dir = settings.OUTPUT_DIR
 
     file_path = output_dir / filename
-    if not file_path.exists():
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found")
+    try:
+        # A single stat doubles as the existence check and is passed on so
+        # FileResponse doesn't have to stat the file again. Malformed names
+        # (e.g. embedded NUL bytes) raise ValueError rather than OSError.
+        stat_result = file_path.stat()
+    except (OSError, ValueError) as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found") from e
 
-    return FileResponse(path=file_path, filename=filename, media_type="application/pdf")
+    return PDFFileResponse(path=file_path, filename=filename, media_type="application/pdf", stat_result=stat_result)
 
 
 @router.get("/preview/{file_type}/{filename}", response_model=None)
@@ -208,28 +268,30 @@ async def preview_file(request: Request, file_type: str, filename: str) -> FileR
     settings: Settings = request.state.settings
     paths = _get_paths(settings)
 
-    if file_type == "cv":
-        file_path = paths["cvs_dir"] / filename
-    elif file_type == "cover_letter":
-        file_path = paths["cover_letters_dir"] / filename
-    elif file_type == "attachment":
-        file_path = paths["attachments_dir"] / filename
-    elif file_type == "personal_information":
-        personal_info_dir = settings.DATA_DIR / "personal_information"
-        file_path = personal_info_dir / filename
-    else:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid file type")
-
-    if not file_path.exists():
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found")
+    try:
+        dir_key, _ = _FILE_TYPE_MAP[file_type]
+    except KeyError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid file type") from e
+
+    file_path = paths[dir_key] / filename
+
+    try:
+        stat_result = file_path.stat()
+    except (OSError, ValueError) as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found") from e
 
     file_extension = file_path.suffix
 
     if file_extension.lower() == ".pdf":
-        return FileResponse(path=file_path, media_type="application/pdf", headers={"Content-Disposition": "inline"})
+        return PDFFileResponse(
+            path=file_path,
+            media_type="application/pdf",
+            stat_result=stat_result,
+            headers={"Content-Disposition": "inline"},
+        )
 
     try:
-        content = file_path.read_text(encoding="utf-8")
+        content = await asyncio.to_thread(file_path.read_text, encoding="utf-8")
         return {"filename": filename, "content": content, "file_type": file_extension}
     except UnicodeDecodeError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Binary file preview not supported.") from e
@@ -241,18 +303,12 @@ async def list_files(request: Request, file_type: str) -> list[str]:
     settings: Settings = request.state.settings
     paths = _get_paths(settings)
 
-    if file_type == "cv":
-        files = sorted([f.name for f in paths["cvs_dir"].glob("*.tex")])
-    elif file_type == "cover_letter":
-        files = sorted([f.name for f in paths["cover_letters_dir"].glob("*.tex")])
-    elif file_type == "personal_information":
-        personal_info_dir = settings.DATA_DIR / "personal_information"
-        personal_info_dir.mkdir(parents=True, exist_ok=True)
-        files = sorted([f.name for f in personal_info_dir.glob("*.txt")])
-    else:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid file type")
+    try:
+        dir_key, extension = _FILE_TYPE_MAP[file_type]
+    except KeyError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid file type") from e
 
-    return files
+    return _list_suffix(paths[dir_key], extension)
 
 
 @router.post("/save", response_model=DocumentSaveResponse)
@@ -261,20 +317,14 @@ async def save_file(request: Request, data: DocumentSaveRequest) -> DocumentSave
     settings: Settings = request.state.settings
     paths = _get_paths(settings)
 
-    # Determine save directory and file extension based on file type
-    if data.file_type == "cv":
-        save_dir = paths["cvs_dir"]
-        extension = ".tex"
-    elif data.file_type == "cover_letter":
-        save_dir = paths["cover_letters_dir"]
-        extension = ".tex"
-    elif data.file_type == "personal_information":
-        save_dir = settings.DATA_DIR / "personal_information"
-        save_dir.mkdir(parents=True, exist_ok=True)
-        extension = ".txt"
-    else:
+    # Determine save directory and file extension based on file type.
+    # Attachments are uploaded binaries and not editable through this route.
+    if data.file_type == "attachment" or data.file_type not in _FILE_TYPE_MAP:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid file type for saving")
 
+    dir_key, extension = _FILE_TYPE_MAP[data.file_type]
+    save_dir = paths[dir_key]
+
     # Determine the target filename
     target_filename = data.new_filename.strip() if data.new_filename and data.new_filename.strip() else None
 
@@ -287,10 +337,9 @@ async def save_file(request: Request, data: DocumentSaveRequest) -> DocumentSave
         target_filename += extension
 
     file_path = save_dir / target_filename
-    save_dir.mkdir(parents=True, exist_ok=True)
 
     # Security check: ensure file is within the save directory
-    if not str(file_path.resolve()).startswith(str(save_dir.resolve())):
+    if not file_path.resolve().is_relative_to(_resolved(save_dir)):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid filename")
 
     try:
@@ -311,11 +360,17 @@ async def get_generation_history(
     limit: int = 50,
 ) -> list[GenerationHistoryResponse]:
     """Get document generation history."""
-    stmt = select(GenerationHistory).order_by(GenerationHistory.created_at.desc()).limit(limit)
-    result = await db.execute(stmt)
-    history = result.scalars().all()
+    # Stream rows in server-side batches instead of materializing the full
+    # result list before validation.
+    stmt = (
+        select(GenerationHistory)
+        .order_by(GenerationHistory.created_at.desc())
+        .limit(limit)
+        .execution_options(yield_per=200)
+    )
+    result = await db.stream_scalars(stmt)
 
-    return [GenerationHistoryResponse.model_validate(h) for h in history]
+    return [GenerationHistoryResponse.model_validate(h) async for h in result]
 
 
 @router.get("/preview/{generation_id}")
@@ -337,12 +392,19 @@ async def preview_generated_document(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Generation record not found")
 
     file_path = output_dir / generation.filename
-    if not file_path.exists():
+    try:
+        stat_result = file_path.stat()
+    except (OSError, ValueError) as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=f"Generated file no longer exists: {generation.filename}"
-        )
+        ) from e
 
-    return FileResponse(path=file_path, media_type="application/pdf", headers={"Content-Disposition": "inline"})
+    return PDFFileResponse(
+        path=file_path,
+        media_type="application/pdf",
+        stat_result=stat_result,
+        headers={"Content-Disposition": "inline"},
+    )
 
 
 @router.delete("/history/{generation_id}")
@@ -369,13 +431,10 @@ async def clear_generation_history(
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> dict[str, str]:
     """Clear all generation history records."""
-    stmt = select(GenerationHistory)
-    result = await db.execute(stmt)
-    records = result.scalars().all()
-
-    for record in records:
-        await db.delete(record)
+    count_result = await db.execute(select(func.count()).select_from(GenerationHistory))
+    count = count_result.scalar_one()
 
+    await db.execute(delete(GenerationHistory))
     await db.commit()
 
-    return {"message": f"Deleted {len(records)} generation history records"}
+    return {"message": f"Deleted {count} generation history records"}
@@ -4,7 +4,9 @@ import logging
 from typing import Annotated
 
 import httpx
-from fastapi import APIRouter, Depends, HTTPException
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from pydantic import TypeAdapter
 from pydantic_ai import Agent
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -23,12 +25,17 @@ from applique_backend.services.llm import get_model
 router = APIRouter(prefix="/llm", tags=["llm"])
 logger = logging.getLogger(__name__)
 
+# Precompiled validator/serializer for the config list: one C-level pass for
+# validation and one for JSON encoding instead of per-row Python calls.
+_CONFIG_LIST_ADAPTER = TypeAdapter(list[LLMConfigResponse])
+
 
 @router.get("/configs", response_model=list[LLMConfigResponse])
-async def get_llm_configs(db: Annotated[AsyncSession, Depends(get_db)]) -> list[LLMConfigResponse]:
+async def get_llm_configs(db: Annotated[AsyncSession, Depends(get_db)]) -> Response:
     """Get all LLM configurations."""
     configs = await crud.get_all_llm_configs(db)
-    return [LLMConfigResponse.model_validate(config) for config in configs]
+    validated = _CONFIG_LIST_ADAPTER.validate_python(configs, from_attributes=True)
+    return Response(content=_CONFIG_LIST_ADAPTER.dump_json(validated), media_type="application/json")
 
 
 @router.post("/configs", response_model=LLMConfigResponse, status_code=201)
@@ -61,8 +68,7 @@ async def test_existing_llm_config(
 ) -> LLMTestConnectionResponse:
     """Test connection for an existing LLM configuration."""
     # Get the config from database
-    configs = await crud.get_all_llm_configs(db)
-    config = next((c for c in configs if c.id == config_id), None)
+    config = await crud.get_llm_config_by_id(db, config_id=config_id)
 
     if not config:
         raise HTTPException(status_code=404, detail="LLM configuration not found")
@@ -106,7 +112,7 @@ async def test_llm_connection(data: LLMTestConnectionRequest) -> LLMTestConnecti
 
 
 @router.post("/fetch-models", response_model=LLMFetchModelsResponse)
-async def fetch_models(data: LLMFetchModelsRequest) -> LLMFetchModelsResponse:
+async def fetch_models(data: LLMFetchModelsRequest, request: Request) -> LLMFetchModelsResponse:
     """Fetch available models from an LLM provider."""
     target_url = data.base_url.rstrip("/")
     if not target_url.endswith("/models"):
@@ -116,13 +122,15 @@ async def fetch_models(data: LLMFetchModelsRequest) -> LLMFetchModelsResponse:
     if data.api_key:
         headers["Authorization"] = f"Bearer {data.api_key}"
 
+    client: httpx.AsyncClient = request.state.http_client
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(target_url, headers=headers)
-            response.raise_for_status()
-            response_data = response.json()
-            models = sorted(m["id"] for m in response_data.get("data", []))
-            return LLMFetchModelsResponse(models=models)
+        response = await client.get(target_url, headers=headers)
+        response.raise_for_status()
+        # orjson parses large provider catalogs noticeably faster than the
+        # stdlib json used by response.json().
+        response_data = orjson.loads(response.content)
+        models = sorted(m["id"] for m in response_data.get("data", []))
+        return LLMFetchModelsResponse(models=models)
     except Exception as e:
         logger.error("Failed to fetch models from %s: %s", target_url, e)
         raise HTTPException(status_code=400, detail=str(e)) from e
@@ -1,24 +1,42 @@
 """API routes for job postings."""
 
+import asyncio
 import logging
+from collections import defaultdict
 from typing import Annotated
+from urllib.parse import urlsplit
 
 import httpx
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
-from pydantic import BaseModel
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response
+from pydantic import BaseModel, TypeAdapter
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from applique_backend.api.deps import get_db
 from applique_backend.api.schemas import PostingCreateRequest, PostingResponse, PostingUpdateRequest
 from applique_backend.db import crud
 from applique_backend.db.models import ExtractionStatus, JobPosting
 from applique_backend.services import extraction
+from applique_backend.services.extraction import JobMetadata
 from applique_backend.services.prompts.manager import PromptManager
 
 router = APIRouter(prefix="/postings", tags=["postings"])
 logger = logging.getLogger(__name__)
 
+# Precompiled validator/serializer for the posting list: one C-level pass for
+# validation and one for JSON encoding instead of per-row Python calls.
+_POSTING_LIST_ADAPTER = TypeAdapter(list[PostingResponse])
+
+# Everything but full_content goes into generated_metadata; precomputing the
+# include-set keeps the per-extraction dump on Pydantic's fast include path.
+_META_INCLUDE: set[str] = set(JobMetadata.model_fields) - {"full_content"}
+
+# Stored error messages are capped so a provider stack trace can't bloat the row
+_ERROR_MSG_LIMIT = 500
+
+# Max concurrent validation requests against a single host
+_PER_HOST_CONCURRENCY = 4
+
 
 class URLValidationResult(BaseModel):
     """Result of URL validation check."""
@@ -40,10 +58,11 @@ class URLValidationResponse(BaseModel):
 
 
 @router.get("", response_model=list[PostingResponse])
-async def get_postings(db: Annotated[AsyncSession, Depends(get_db)]) -> list[PostingResponse]:
+async def get_postings(db: Annotated[AsyncSession, Depends(get_db)]) -> Response:
     """Get all job postings."""
     postings = await crud.get_all_postings(db)
-    return [PostingResponse.model_validate(posting) for posting in postings]
+    validated = _POSTING_LIST_ADAPTER.validate_python(postings, from_attributes=True)
+    return Response(content=_POSTING_LIST_ADAPTER.dump_json(validated), media_type="application/json")
 
 
 @router.post("", response_model=PostingResponse, status_code=201)
@@ -57,7 +76,9 @@ async def create_posting(
     posting = await crud.create_posting(db, url=data.url, description=data.description)
 
     if data.trigger_extraction:
-        background_tasks.add_task(run_extraction_task, posting.id, db, request.state.prompt_manager)
+        background_tasks.add_task(
+            run_extraction_task, posting.id, request.state.session_maker, request.state.prompt_manager
+        )
 
     return PostingResponse.model_validate(posting)
 
@@ -74,7 +95,9 @@ async def trigger_extraction(
     if not posting:
         raise HTTPException(status_code=404, detail="Posting not found")
 
-    background_tasks.add_task(run_extraction_task, posting_id, db, request.state.prompt_manager)
+    background_tasks.add_task(
+        run_extraction_task, posting_id, request.state.session_maker, request.state.prompt_manager
+    )
     return PostingResponse.model_validate(posting)
 
 
@@ -95,17 +118,15 @@ async def update_posting_metadata(
     full_content = data.full_content
     metadata = data.model_dump(exclude={"full_content"})
 
-    await crud.update_posting_metadata(
+    # The CRUD layer uses UPDATE ... RETURNING, so the refreshed row comes back
+    # without a second round-trip.
+    posting = await crud.update_posting_metadata(
         db,
         posting_id=posting_id,
         metadata=metadata,
         full_content=full_content,
     )
 
-    stmt = select(JobPosting).where(JobPosting.id == posting_id)
-    result = await db.execute(stmt)
-    posting = result.scalars().first()
-
     if not posting:
         raise HTTPException(status_code=404, detail="Posting not found")
 
@@ -126,37 +147,48 @@ async def get_posting(posting_id: int, db: Annotated[AsyncSession, Depends(get_d
 
 
 @router.post("/validate-urls", response_model=URLValidationResponse)
-async def validate_posting_urls(db: Annotated[AsyncSession, Depends(get_db)]) -> URLValidationResponse:
+async def validate_posting_urls(
+    db: Annotated[AsyncSession, Depends(get_db)], request: Request
+) -> URLValidationResponse:
     """Validate all job posting URLs to check if they still exist."""
     postings = await crud.get_all_postings(db)
-    results: list[URLValidationResult] = []
     http_success_threshold = 400
 
-    async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
-        for posting in postings:
-            try:
+    # Dispatch all HEAD requests concurrently over the shared app-wide client;
+    # total latency is bounded by the slowest host instead of the sum of all
+    # round-trips.
+    client: httpx.AsyncClient = request.state.http_client
+    valid_count = 0
+    # Fan out wide across hosts but bound in-flight requests per host, so a
+    # job board with many postings doesn't rate-limit us into false negatives.
+    host_sems: dict[str, asyncio.Semaphore] = defaultdict(lambda: asyncio.Semaphore(_PER_HOST_CONCURRENCY))
+
+    async def check(posting: JobPosting) -> URLValidationResult:
+        nonlocal valid_count
+        # model_construct skips per-field validation; all values here are
+        # produced internally from trusted types.
+        try:
+            async with host_sems[urlsplit(posting.url).netloc]:
                 response = await client.head(posting.url)
-                is_valid = response.status_code < http_success_threshold
-                results.append(
-                    URLValidationResult(
-                        posting_id=posting.id,
-                        url=posting.url,
-                        is_valid=is_valid,
-                        status_code=response.status_code,
-                    )
-                )
-            except Exception as e:
-                logger.warning("Failed to validate URL %s: %s", posting.url, str(e))
-                results.append(
-                    URLValidationResult(
-                        posting_id=posting.id,
-                        url=posting.url,
-                        is_valid=False,
-                        error_message=str(e),
-                    )
-                )
-
-    valid_count = sum(1 for r in results if r.is_valid)
+            is_valid = response.status_code < http_success_threshold
+            valid_count += is_valid
+            return URLValidationResult.model_construct(
+                posting_id=posting.id,
+                url=posting.url,
+                is_valid=is_valid,
+                status_code=response.status_code,
+            )
+        except Exception as e:
+            logger.warning("Failed to validate URL %s: %s", posting.url, str(e))
+            return URLValidationResult.model_construct(
+                posting_id=posting.id,
+                url=posting.url,
+                is_valid=False,
+                error_message=str(e),
+            )
+
+    results: list[URLValidationResult] = list(await asyncio.gather(*(check(posting) for posting in postings)))
+
     invalid_count = len(results) - valid_count
 
     return URLValidationResponse(
@@ -169,11 +201,24 @@ async def validate_posting_urls(db: Annotated[AsyncSession, Depends(get_db)]) ->
 
 async def run_extraction_task(
     posting_id: int,
-    db: AsyncSession,
+    session_maker: async_sessionmaker[AsyncSession],
     prompt_manager: PromptManager,
 ) -> None:
-    """Background task to run AI extraction."""
-    await crud.update_posting_metadata(db, posting_id, status=ExtractionStatus.PROCESSING, error_message="")
+    """Background task to run AI extraction.
+
+    Opens its own session: the request-scoped one is closed once the response
+    is sent, so reusing it here would run against a dead session and pin a
+    pool connection.
+    """
+    async with session_maker() as db:
+        await _run_extraction(db, posting_id, prompt_manager)
+
+
+async def _run_extraction(db: AsyncSession, posting_id: int, prompt_manager: PromptManager) -> None:
+    # Status pings discard the updated row, so skip the RETURNING round-trip
+    await crud.update_posting_metadata(
+        db, posting_id, status=ExtractionStatus.PROCESSING, error_message="", return_row=False
+    )
 
     llm_config = await crud.get_active_llm_config(db)
     if not llm_config:
@@ -182,6 +227,7 @@ async def run_extraction_task(
             posting_id,
             status=ExtractionStatus.FAILED,
             error_message="No active LLM configuration found. Please configure an LLM provider first.",
+            return_row=False,
         )
         return
 
@@ -197,21 +243,23 @@ async def run_extraction_task(
         await crud.update_posting_metadata(
             db,
             posting_id,
-            metadata=metadata_obj.model_dump(exclude={"full_content"}),
+            metadata=metadata_obj.model_dump(include=_META_INCLUDE),
             status=ExtractionStatus.COMPLETED,
             full_content=metadata_obj.full_content,
             error_message="",
             status_updated=True,
+            return_row=False,
         )
     except Exception as e:
         logger.exception("Extraction failed for posting %s", posting_id)
         error_msg = str(e)
-        if len(error_msg) > 500:  # noqa: PLR2004
-            error_msg = error_msg[:497] + "..."
+        if len(error_msg) > _ERROR_MSG_LIMIT:
+            error_msg = error_msg[: _ERROR_MSG_LIMIT - 3] + "..."
         await crud.update_posting_metadata(
             db,
             posting_id,
             status=ExtractionStatus.FAILED,
             error_message=error_msg,
             status_updated=True,
+            return_row=False,
         )
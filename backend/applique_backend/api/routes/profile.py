@@ -4,12 +4,11 @@ import logging
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Request
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from applique_backend.api.deps import get_db
 from applique_backend.api.schemas import UserProfileResponse, UserProfileUpdateRequest
-from applique_backend.db.models import UserProfile
+from applique_backend.db import crud
 
 router = APIRouter(prefix="/profile", tags=["profile"])
 logger = logging.getLogger(__name__)
@@ -21,19 +20,8 @@ async def get_profile(
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> UserProfileResponse:
     """Get user profile. Creates default profile if none exists."""
-    # For single-user app, we'll just get/create the first profile
-    stmt = select(UserProfile).limit(1)
-    result = await db.execute(stmt)
-    profile = result.scalars().first()
-
-    if not profile:
-        # Create default profile
-        profile = UserProfile()
-        db.add(profile)
-        await db.commit()
-        await db.refresh(profile)
-        logger.info("Created default user profile")
-
+    # For single-user app, the profile is upserted into a well-known row
+    profile = await crud.get_or_create_profile(db)
     return UserProfileResponse.model_validate(profile)
 
 
@@ -44,21 +32,9 @@ async def update_profile(
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> UserProfileResponse:
     """Update user profile."""
-    # Get or create profile
-    stmt = select(UserProfile).limit(1)
-    result = await db.execute(stmt)
-    profile = result.scalars().first()
-
-    if not profile:
-        profile = UserProfile()
-        db.add(profile)
-
-    # Update fields
-    for field, value in data.model_dump(exclude_unset=True).items():
-        setattr(profile, field, value)
-
-    await db.commit()
-    await db.refresh(profile)
+    # Single INSERT ... ON CONFLICT DO UPDATE round-trip instead of
+    # select + insert/update + refresh
+    profile = await crud.upsert_profile(db, values=data.model_dump(exclude_unset=True))
 
     logger.info("Updated user profile")
     return UserProfileResponse.model_validate(profile)
@@ -2,9 +2,10 @@
 
 import logging
 from typing import TypedDict
+from weakref import WeakKeyDictionary
 
 from fastapi import APIRouter, HTTPException, Request, status
-from jinja2 import Template
+from jinja2 import Environment
 
 from applique_backend.api.schemas import (
     PromptDetail,
@@ -15,11 +16,15 @@ from applique_backend.api.schemas import (
     PromptSaveRequest,
     PromptSaveResponse,
 )
-from applique_backend.services.prompts.manager import PromptTemplate
+from applique_backend.services.prompts.manager import PromptManager, PromptTemplate
 
 router = APIRouter(prefix="/prompts", tags=["prompts"])
 logger = logging.getLogger(__name__)
 
+# Shared environment for template validation; compiling (without rendering)
+# catches both syntax errors and compile-time failures such as unknown filters.
+_VALIDATION_ENV = Environment(autoescape=False)  # noqa: S701
+
 
 class PromptMetadata(TypedDict):
     """Metadata for a prompt template."""
@@ -53,20 +58,33 @@ PROMPT_METADATA: dict[PromptTemplate, PromptMetadata] = {
 }
 
 
+# Prompt listing cached per manager instance against its customization version
+# so repeat polls skip the per-template checks. Keyed weakly: entries vanish
+# with their manager, and two managers never see each other's state.
+_prompt_list_cache: WeakKeyDictionary[PromptManager, tuple[int, list[PromptInfo]]] = WeakKeyDictionary()
+
+
 @router.get("", response_model=list[PromptInfo])
 async def list_prompts(request: Request) -> list[PromptInfo]:
     """List all available prompt templates with their customization status."""
     prompt_mgr = request.state.prompt_manager
+    version = prompt_mgr.customization_version
+    cached = _prompt_list_cache.get(prompt_mgr)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    customized = prompt_mgr.list_customized()
     prompts = [
         PromptInfo(
             name=template.value,
             display_name=PROMPT_METADATA[template]["display_name"],
             description=PROMPT_METADATA[template]["description"],
-            is_customized=prompt_mgr.is_customized(template),
+            is_customized=template in customized,
             variables=PROMPT_METADATA[template]["variables"],
         )
         for template in PromptTemplate
     ]
+    _prompt_list_cache[prompt_mgr] = (version, prompts)
     return prompts
 
 
@@ -118,11 +136,9 @@ async def update_prompt(
     template = PromptTemplate(template_name)
     prompt_mgr = request.state.prompt_manager
 
-    # Validate template syntax by attempting to render it
+    # Validate template syntax (compile only, no rendering)
     try:
-        # Try rendering with empty context to validate syntax
-        jinja_template = Template(request_body.content, autoescape=False)
-        jinja_template.render({})
+        _VALIDATION_ENV.from_string(request_body.content)
     except Exception as e:
         logger.error("Invalid Jinja template syntax for '%s': %s", template_name, e)
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid template syntax: {e}") from e
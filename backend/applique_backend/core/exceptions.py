@@ -1,5 +1,4 @@
 import logging
-import traceback
 
 from fastapi import FastAPI, Request, status
 from fastapi.exception_handlers import http_exception_handler, request_validation_exception_handler
@@ -10,37 +9,39 @@ from starlette.responses import JSONResponse, Response
 logger = logging.getLogger(__name__)
 
 
-def register_exception_handlers(app: FastAPI) -> None:
-    """Register custom exception handlers for the FastAPI app."""
+async def _handle_exception(request: Request, exc: Exception) -> Response:
+    """Single dispatcher for all registered exception types.
 
-    @app.exception_handler(StarletteHTTPException)
-    async def custom_http_exception_handler(request: Request, exc: StarletteHTTPException) -> Response:
-        logger.warning(
-            "HTTP exception occurred",
-            extra={
-                "status_code": exc.status_code,
-                "detail": exc.detail,
-                "path": request.url.path,
-                "method": request.method,
-            },
-        )
+    Log-level gates keep the extra dict and URL attribute traversal off the
+    path when the record would be filtered anyway.
+    """
+    if isinstance(exc, StarletteHTTPException):
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                "HTTP exception occurred",
+                extra={
+                    "status_code": exc.status_code,
+                    "detail": exc.detail,
+                    "path": request.url.path,
+                    "method": request.method,
+                },
+            )
         return await http_exception_handler(request, exc)
 
-    @app.exception_handler(RequestValidationError)
-    async def validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
-        logger.warning(
-            "Request validation error",
-            extra={
-                "path": request.url.path,
-                "method": request.method,
-                "errors": exc.errors(),
-            },
-        )
+    if isinstance(exc, RequestValidationError):
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                "Request validation error",
+                extra={
+                    "path": request.url.path,
+                    "method": request.method,
+                    "errors": exc.errors(),
+                },
+            )
         return await request_validation_exception_handler(request, exc)
 
-    @app.exception_handler(Exception)
-    async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
-        """Handle all uncaught exceptions and log them with full traceback."""
+    # exc_info already renders the full traceback once per 500
+    if logger.isEnabledFor(logging.ERROR):
         logger.error(
             "Unhandled exception occurred",
             exc_info=exc,
@@ -50,13 +51,21 @@ def register_exception_handlers(app: FastAPI) -> None:
                 "exception_type": type(exc).__name__,
             },
         )
-        # Log the full traceback
-        logger.error(
-            "Traceback:\n%s",
-            "".join(traceback.format_exception(type(exc), exc, exc.__traceback__)),
-        )
 
-        return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content={"detail": "Internal server error"},
-        )
+    return JSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content={"detail": "Internal server error"},
+    )
+
+
+def register_exception_handlers(app: FastAPI) -> None:
+    """Register custom exception handlers for the FastAPI app.
+
+    All three registrations point at the same dispatcher; the explicit
+    HTTPException/RequestValidationError entries are still needed because
+    FastAPI pre-registers default handlers for them, which would otherwise
+    win the MRO lookup over a plain Exception handler.
+    """
+    app.add_exception_handler(StarletteHTTPException, _handle_exception)
+    app.add_exception_handler(RequestValidationError, _handle_exception)
+    app.add_exception_handler(Exception, _handle_exception)
@@ -16,6 +16,10 @@ class OTELExporter(StrEnum):
     OTLP = "otlp"
 
 
+# Exporter values that turn telemetry on
+_OTEL_ENABLED_VALUES: frozenset[OTELExporter] = frozenset({OTELExporter.OTLP, OTELExporter.CONSOLE})
+
+
 class Settings(BaseSettings):
     VERSION: str = "0.1.0"
     """Version of the application."""
@@ -64,7 +68,12 @@ class Settings(BaseSettings):
     """User-customizable prompt templates directory."""
 
     ENABLE_PROMPT_HOT_RELOAD: bool = False
-    """Enable hot reloading of prompt templates without restart."""
+    """Enable hot reloading of prompt templates without restart.
+
+    Development-only: Jinja's auto_reload stats every template file on each
+    render, so the default (off) is the production-optimal setting and the
+    flag is forced off inside Docker deployments.
+    """
 
     RUNNING_IN_DOCKER: bool = False
     """Whether the application is running inside a Docker container."""
@@ -74,6 +83,8 @@ class Settings(BaseSettings):
     OTEL_SERVICE_NAME: str = "applique"
     OTEL_EXPORTER_OTLP_ENDPOINT: str | None = None
     OTEL_TRACES_EXPORTER: OTELExporter | None = None
+    OTEL_TRACES_SAMPLE_RATIO: float = 0.1
+    """Fraction of traces to sample; span creation is a per-query cost, so default to 10%."""
     OTEL_METRICS_EXPORTER: OTELExporter | None = None
     OTEL_LOGS_EXPORTER: OTELExporter | None = None
 
@@ -83,12 +94,13 @@ class Settings(BaseSettings):
 
     @model_validator(mode="after")
     def _post_setup(self) -> Self:
+        if self.RUNNING_IN_DOCKER:
+            # Hot reload exists for local template editing only; never pay the
+            # per-render stat in container deployments.
+            self.ENABLE_PROMPT_HOT_RELOAD = False
         if not self._OTEL_ENABLED:
-            for value in (self.OTEL_METRICS_EXPORTER, self.OTEL_LOGS_EXPORTER, self.OTEL_TRACES_EXPORTER):
-                match value:
-                    case OTELExporter.OTLP | OTELExporter.CONSOLE:
-                        self._OTEL_ENABLED = True
-                        break
-                    case _:
-                        continue
+            self._OTEL_ENABLED = any(
+                value in _OTEL_ENABLED_VALUES
+                for value in (self.OTEL_METRICS_EXPORTER, self.OTEL_LOGS_EXPORTER, self.OTEL_TRACES_EXPORTER)
+            )
         return self
@@ -1,5 +1,6 @@
 import logging
 import os
+import re
 
 from fastapi import FastAPI
 from opentelemetry import metrics, trace
@@ -16,6 +17,7 @@ from opentelemetry.sdk.metrics import MeterProvider
 from opentelemetry.sdk.metrics.export import ConsoleMetricExporter, PeriodicExportingMetricReader
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
 from pydantic_ai import Agent
 
 from applique_backend.core.settings import OTELExporter, Settings
@@ -26,6 +28,11 @@ class UvicornAccessLoggingFilter(logging.Filter):
         """Logging filter to exclude certain endpoints from access logs."""
         super().__init__()
         self.excluded_endpoints = excluded_endpoints
+        # One compiled alternation replaces a Python-level substring check per
+        # endpoint on every access-log record.
+        self._excluded_re = (
+            re.compile("|".join(re.escape(endpoint) for endpoint in excluded_endpoints)) if excluded_endpoints else None
+        )
 
     def filter(self, record: logging.LogRecord) -> bool:
         """Filter out log records for excluded endpoints.
@@ -34,10 +41,11 @@ class UvicornAccessLoggingFilter(logging.Filter):
         writing the record args are: client_addr, method, full_path, http_version, status_code
         (see https://github.com/Kludex/uvicorn/blob/main/uvicorn/logging.py)
         """
-        if not record.args or len(record.args) < 3:  # noqa: PLR2004
+        args = record.args
+        if self._excluded_re is None or not isinstance(args, tuple) or len(args) < 3:  # noqa: PLR2004
             return True
 
-        return all(endpoint not in record.args[2] for endpoint in self.excluded_endpoints)
+        return self._excluded_re.search(str(args[2])) is None
 
 
 def setup_telemetry(settings: Settings, app: FastAPI) -> None:
@@ -48,20 +56,22 @@ def setup_telemetry(settings: Settings, app: FastAPI) -> None:
     """
     if settings.otel_enabled:
         os.environ.setdefault("OTEL_SERVICE_NAME", settings.OTEL_SERVICE_NAME)
-        _setup_traces(settings.OTEL_TRACES_EXPORTER)
+        _setup_traces(settings.OTEL_TRACES_EXPORTER, settings.OTEL_TRACES_SAMPLE_RATIO)
         _setup_metrics(settings.OTEL_METRICS_EXPORTER)
         _setup_logs(settings.OTEL_LOGS_EXPORTER)
 
         HTTPXClientInstrumentor().instrument()
         OpenAIInstrumentor().instrument()
+        # The instrumentor joins these into one compiled regex and matches
+        # with re.search, so the old ".*" prefixes only added backtracking
         FastAPIInstrumentor.instrument_app(
             app,
-            excluded_urls=".*/openapi.json,.*/docs,.*/healthz,.*/readyz,.*/static/,.*/metrics",
+            excluded_urls="/openapi.json,/docs,/healthz,/readyz,/static/,/metrics",
         )
         Agent.instrument_all()
 
 
-def _setup_traces(exporter_name: OTELExporter | None) -> None:
+def _setup_traces(exporter_name: OTELExporter | None, sample_ratio: float = 1.0) -> None:
     match exporter_name:
         case OTELExporter.OTLP:
             exporter = OTLPSpanExporter()
@@ -72,7 +82,9 @@ def _setup_traces(exporter_name: OTELExporter | None) -> None:
         case _:
             raise ValueError(f"OTEL_TRACES_EXPORTER={exporter_name} unsupported")
 
-    trace_provider = TracerProvider()
+    # Head sampling cuts span creation volume; ParentBased keeps child spans
+    # (e.g. per-query SQLAlchemy spans) consistent with their sampled parent.
+    trace_provider = TracerProvider(sampler=ParentBased(TraceIdRatioBased(sample_ratio)))
     trace_provider.add_span_processor(BatchSpanProcessor(exporter))
     trace.set_tracer_provider(trace_provider)
 
@@ -1,3 +1,6 @@
+from typing import Any
+
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     AsyncAttrs,
     AsyncSession,
@@ -14,9 +17,36 @@ class Base(AsyncAttrs, DeclarativeBase):
     pass
 
 
+# WAL lets concurrent reads proceed during writes, synchronous=NORMAL drops
+# one fsync per commit (still durable in WAL mode), temp structures stay in
+# memory, and mmap serves pages from the OS cache without copying.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=134217728",
+)
+
+
 async def setup_db(settings: Settings) -> tuple[AsyncEngine, async_sessionmaker[AsyncSession]]:
     """Setup database connection."""
-    engine = create_async_engine(settings.DATABASE_DSN, echo=False)
+    # Pool sizing is the single knob for how many concurrent requests and
+    # background extractions can hold a connection at once. In-memory SQLite
+    # uses a StaticPool that takes no sizing arguments.
+    engine_kwargs: dict[str, Any] = {"echo": False}
+    if ":memory:" not in settings.DATABASE_DSN:
+        engine_kwargs |= {"pool_size": 10, "max_overflow": 20}
+    engine = create_async_engine(settings.DATABASE_DSN, **engine_kwargs)
+
+    if settings.DATABASE_DSN.startswith("sqlite"):
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def _set_sqlite_pragmas(dbapi_conn: Any, _connection_record: Any) -> None:
+            cursor = dbapi_conn.cursor()
+            for pragma in SQLITE_PRAGMAS:
+                cursor.execute(pragma)
+            cursor.close()
+
     session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
     async with engine.begin() as conn:
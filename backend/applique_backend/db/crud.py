@@ -1,9 +1,15 @@
+import datetime as dt
 from collections.abc import Sequence
+from typing import Any
 
-from sqlalchemy import delete, select, update
+from sqlalchemy import case, delete, func, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from applique_backend.db.models import ExtractionStatus, JobPosting, LLMConfiguration
+from applique_backend.db.models import ExtractionStatus, JobPosting, LLMConfiguration, UserProfile
+
+# The app is single-user; the profile always lives in a well-known row.
+PROFILE_ID = 1
 
 
 async def get_all_llm_configs(session: AsyncSession) -> Sequence[LLMConfiguration]:
@@ -20,10 +26,9 @@ async def create_llm_config(
     base_url: str | None = None,
     is_active: bool = False,
 ) -> LLMConfiguration:
-    # Check if we have any existing configs
-    stmt = select(LLMConfiguration).limit(1)
-    result = await session.execute(stmt)
-    has_existing = result.scalars().first() is not None
+    # Existence check on the id column only — no ORM hydration needed
+    stmt = select(LLMConfiguration.id).limit(1)
+    has_existing = (await session.execute(stmt)).scalar() is not None
 
     if not has_existing:
         # If this is the first config, force it to be active
@@ -41,21 +46,28 @@ async def create_llm_config(
         is_active=is_active,
     )
     session.add(llm_config)
+    # The INSERT's RETURNING already populates id and server defaults at
+    # flush time, so no post-commit refresh SELECT is needed
+    await session.flush()
     await session.commit()
-    await session.refresh(llm_config)
     return llm_config
 
 
+async def get_llm_config_by_id(session: AsyncSession, config_id: int) -> LLMConfiguration | None:
+    stmt = select(LLMConfiguration).where(LLMConfiguration.id == config_id)
+    result = await session.execute(stmt)
+    return result.scalars().first()
+
+
 async def delete_llm_config(session: AsyncSession, config_id: int) -> None:
     await session.execute(delete(LLMConfiguration).where(LLMConfiguration.id == config_id))
     await session.commit()
 
 
 async def set_active_llm_config(session: AsyncSession, config_id: int) -> None:
-    # Set all to inactive
-    await session.execute(update(LLMConfiguration).values(is_active=False))
-    # Set specific one to active
-    await session.execute(update(LLMConfiguration).where(LLMConfiguration.id == config_id).values(is_active=True))
+    # Single CASE update flips the active flag for every row in one statement
+    stmt = update(LLMConfiguration).values(is_active=case((LLMConfiguration.id == config_id, True), else_=False))
+    await session.execute(stmt)
     await session.commit()
 
 
@@ -74,8 +86,10 @@ async def get_all_postings(session: AsyncSession) -> Sequence[JobPosting]:
 async def create_posting(session: AsyncSession, url: str, description: str | None = None) -> JobPosting:
     posting = JobPosting(url=url, description=description)
     session.add(posting)
+    # The INSERT's RETURNING already populates id and server defaults at
+    # flush time, so no post-commit refresh SELECT is needed
+    await session.flush()
     await session.commit()
-    await session.refresh(posting)
     return posting
 
 
@@ -88,6 +102,7 @@ async def update_posting_metadata(  # noqa: PLR0913
     full_content: str | None = None,
     error_message: str | None = None,
     status_updated: bool = False,
+    return_row: bool = True,
 ) -> JobPosting | None:
     # Build update values dynamically
     values = {"status_updated": status_updated}
@@ -101,8 +116,14 @@ async def update_posting_metadata(  # noqa: PLR0913
     if error_message is not None:
         values["error_message"] = error_message
 
-    stmt = update(JobPosting).where(JobPosting.id == posting_id).values(**values).returning(JobPosting)
-    result = await session.execute(stmt)
+    stmt = update(JobPosting).where(JobPosting.id == posting_id).values(**values)
+    if not return_row:
+        # Fire-and-forget writers skip the RETURNING serialization + hydrate
+        await session.execute(stmt)
+        await session.commit()
+        return None
+
+    result = await session.execute(stmt.returning(JobPosting))
     await session.commit()
     return result.scalars().first()
 
@@ -117,28 +138,56 @@ async def delete_posting(session: AsyncSession, posting_id: int) -> None:
     await session.commit()
 
 
-async def get_posting_statistics(session: AsyncSession) -> dict:
-    """Get job posting statistics for dashboard."""
-    total = await session.execute(select(JobPosting))
-    total_count = len(total.scalars().all())
+async def get_or_create_profile(session: AsyncSession) -> UserProfile:
+    # INSERT ... ON CONFLICT DO NOTHING RETURNING creates the row in a single
+    # round-trip; the SELECT only runs when the profile already existed.
+    stmt = sqlite_insert(UserProfile).values(id=PROFILE_ID).on_conflict_do_nothing().returning(UserProfile)
+    result = await session.execute(stmt)
+    profile = result.scalars().first()
+    await session.commit()
+
+    if profile is None:
+        result = await session.execute(select(UserProfile).where(UserProfile.id == PROFILE_ID))
+        profile = result.scalars().one()
+    return profile
 
-    pending = await session.execute(
-        select(JobPosting).where(
-            JobPosting.extraction_status.in_([ExtractionStatus.PENDING, ExtractionStatus.PROCESSING])
-        )
-    )
-    pending_count = len(pending.scalars().all())
 
-    completed = await session.execute(
-        select(JobPosting).where(JobPosting.extraction_status == ExtractionStatus.COMPLETED)
+async def upsert_profile(session: AsyncSession, values: dict[str, Any]) -> UserProfile:
+    if not values:
+        return await get_or_create_profile(session)
+
+    # ON CONFLICT DO UPDATE bypasses the ORM onupdate hook, so bump the
+    # timestamp explicitly.
+    set_values = {**values, "updated_at": dt.datetime.now(dt.UTC)}
+    stmt = (
+        sqlite_insert(UserProfile)
+        .values(id=PROFILE_ID, **values)
+        .on_conflict_do_update(index_elements=[UserProfile.id], set_=set_values)
+        .returning(UserProfile)
     )
-    completed_count = len(completed.scalars().all())
+    # populate_existing makes the RETURNING row win over any stale instance
+    # already sitting in the session's identity map.
+    result = await session.execute(stmt, execution_options={"populate_existing": True})
+    profile = result.scalars().one()
+    await session.commit()
+    return profile
+
+
+async def get_posting_statistics(session: AsyncSession) -> dict:
+    """Get job posting statistics for dashboard."""
+    # One GROUP BY aggregate instead of four full-table SELECTs; counting
+    # happens in the database rather than over materialized ORM rows.
+    stmt = select(JobPosting.extraction_status, func.count()).group_by(JobPosting.extraction_status)
+    result = await session.execute(stmt)
+    # Comprehension instead of dict(): unpacking the rows gives typed key/value
+    counts: dict[ExtractionStatus, int] = {status: count for status, count in result.all()}  # noqa: C416
 
-    failed = await session.execute(select(JobPosting).where(JobPosting.extraction_status == ExtractionStatus.FAILED))
-    failed_count = len(failed.scalars().all())
+    pending_count = counts.get(ExtractionStatus.PENDING, 0) + counts.get(ExtractionStatus.PROCESSING, 0)
+    completed_count = counts.get(ExtractionStatus.COMPLETED, 0)
+    failed_count = counts.get(ExtractionStatus.FAILED, 0)
 
     return {
-        "total_postings": total_count,
+        "total_postings": sum(counts.values()),
         "pending_postings": pending_count,
         "completed_postings": completed_count,
         "failed_postings": failed_count,
@@ -7,6 +7,11 @@ from sqlalchemy.orm import Mapped, mapped_column
 from applique_backend.db.core import Base
 
 
+def _utcnow() -> dt.datetime:
+    """Timestamp default, evaluated per INSERT/UPDATE rather than at import."""
+    return dt.datetime.now(dt.UTC)
+
+
 class LLMConfiguration(Base):
     __tablename__ = "llm_configurations"
 
@@ -16,10 +21,8 @@ class LLMConfiguration(Base):
     api_key: Mapped[str | None] = mapped_column(String, nullable=True)
     base_url: Mapped[str | None] = mapped_column(String, nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
-    created_at: Mapped[dt.datetime] = mapped_column(DateTime, default=dt.datetime.now(dt.UTC))
-    updated_at: Mapped[dt.datetime] = mapped_column(
-        DateTime, default=dt.datetime.now(dt.UTC), onupdate=dt.datetime.now(dt.UTC)
-    )
+    created_at: Mapped[dt.datetime] = mapped_column(DateTime, default=_utcnow)
+    updated_at: Mapped[dt.datetime] = mapped_column(DateTime, default=_utcnow, onupdate=_utcnow)
 
 
 class ExtractionStatus(StrEnum):
@@ -44,7 +47,7 @@ class JobPosting(Base):
     )
     error_message: Mapped[str | None] = mapped_column(String, nullable=True)
     status_updated: Mapped[bool] = mapped_column(Boolean, default=False)
-    created_at: Mapped[dt.datetime] = mapped_column(DateTime, default=dt.datetime.now(dt.UTC))
+    created_at: Mapped[dt.datetime] = mapped_column(DateTime, default=_utcnow)
 
 
 class GenerationHistory(Base):
@@ -59,7 +62,7 @@ class GenerationHistory(Base):
     cover_letter_file: Mapped[str | None] = mapped_column(String, nullable=True)
     attachments: Mapped[list | None] = mapped_column(JSON, nullable=True)
     combined: Mapped[bool] = mapped_column(Boolean, default=False)
-    created_at: Mapped[dt.datetime] = mapped_column(DateTime, default=dt.datetime.now(dt.UTC))
+    created_at: Mapped[dt.datetime] = mapped_column(DateTime, default=_utcnow)
 
 
 class UserProfile(Base):
@@ -85,18 +88,10 @@ class UserProfile(Base):
     # Additional custom variables (JSON field for flexibility)
     custom_variables: Mapped[dict | None] = mapped_column(JSON, nullable=True)
     # Timestamps
-    created_at: Mapped[dt.datetime] = mapped_column(DateTime, default=dt.datetime.now(dt.UTC))
-    updated_at: Mapped[dt.datetime] = mapped_column(
-        DateTime, default=dt.datetime.now(dt.UTC), onupdate=dt.datetime.now(dt.UTC)
-    )
+    created_at: Mapped[dt.datetime] = mapped_column(DateTime, default=_utcnow)
+    updated_at: Mapped[dt.datetime] = mapped_column(DateTime, default=_utcnow, onupdate=_utcnow)
 
     @property
     def full_name(self) -> str | None:
         """Generate full name from first and last name."""
-        if self.first_name and self.last_name:
-            return f"{self.first_name} {self.last_name}"
-        if self.first_name:
-            return self.first_name
-        if self.last_name:
-            return self.last_name
-        return None
+        return " ".join(part for part in (self.first_name, self.last_name) if part) or None
@@ -3,7 +3,6 @@ import logging
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
-from tenacity import after_log, before_log, retry, stop_after_attempt, wait_fixed
 
 from applique_backend.core.settings import Settings
 
@@ -14,25 +13,35 @@ MAX_TRIES = 60 * 5  # 5 minutes (1 try/sec)
 WAIT_SECONDS = 1
 
 
-@retry(
-    stop=stop_after_attempt(MAX_TRIES),
-    wait=wait_fixed(WAIT_SECONDS),
-    before=before_log(logger, logging.INFO),
-    after=after_log(logger, logging.WARNING),
-    reraise=True,
-)
 async def init(db_engine: AsyncEngine) -> None:
-    try:
-        async with db_engine.connect() as conn:
-            await conn.execute(select(1))
-    except Exception:
-        logger.exception("Database not ready yet")
-        raise
+    """Wait until the database answers a probe query.
+
+    A plain retry loop: the happy path connects on the first attempt with no
+    wrapper frames or sleeps, and failed attempts back off exponentially up
+    to the fixed per-try cadence.
+    """
+    for attempt in range(1, MAX_TRIES + 1):
+        try:
+            async with db_engine.connect() as conn:
+                await conn.execute(select(1))
+            return
+        except Exception:
+            logger.warning("Database not ready yet (attempt %d/%d)", attempt, MAX_TRIES)
+            await asyncio.sleep(min(2 ** (attempt - 1) * 0.1, WAIT_SECONDS))
+
+    raise RuntimeError(f"Database not reachable after {MAX_TRIES} attempts")
 
 
 async def main() -> None:
     settings = Settings()
-    engine = create_async_engine(settings.DATABASE_DSN)
+    # One pooled connection is enough for the probe; it is reused across
+    # retries instead of opening a fresh connection per attempt, and
+    # pre-ping revalidates it if the database dropped it in between.
+    # In-memory SQLite uses a StaticPool that takes no sizing arguments.
+    engine_kwargs: dict[str, object] = {}
+    if ":memory:" not in settings.DATABASE_DSN:
+        engine_kwargs = {"pool_size": 1, "max_overflow": 0, "pool_pre_ping": True}
+    engine = create_async_engine(settings.DATABASE_DSN, **engine_kwargs)
 
     logger.info("Initializing service")
     try:
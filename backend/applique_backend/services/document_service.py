@@ -1,21 +1,87 @@
 """Service for document generation and PDF operations."""
 
 import asyncio
+import functools
+import hashlib
 import logging
+import os
 import re
+import shutil
 import tempfile
+from contextlib import ExitStack
 from pathlib import Path
-
-from pypdf import PdfWriter
-
-BACKSLASH_PLACEHOLDER = "<<<BACKSLASH>>>"
+from typing import ClassVar
+from uuid import uuid4
+
+try:
+    # RE2 matches in guaranteed linear time (DFA, no backtracking), which is
+    # both faster on multi-KB pdflatex logs and immune to pathological input
+    import re2 as _log_re  # ty: ignore[unresolved-import]
+except ImportError:  # pragma: no cover - optional fast path
+    _log_re = re  # type: ignore[assignment]
+
+BEGIN_DOCUMENT = r"\begin{document}"
+FMT_CACHE_DIR = Path(tempfile.gettempdir()) / "applique-latex-formats"
+PDF_CACHE_DIR = Path(tempfile.gettempdir()) / "applique-pdf-cache"
+PDF_CACHE_MAX_ENTRIES = 128
 logger = logging.getLogger(__name__)
 
-
+# Single-pass LaTeX escaping: str.translate runs entirely in C, replacing
+# each special character from the original string independently — no
+# per-character Python callback and no double-escaping risk.
+_LATEX_ESCAPE_TABLE = str.maketrans(
+    {
+        "\\": r"\textbackslash{}",
+        "&": r"\&",
+        "%": r"\%",
+        "$": r"\$",
+        "#": r"\#",
+        "_": r"\_",
+        "{": r"\{",
+        "}": r"\}",
+        "~": r"\textasciitilde{}",
+        "^": r"\textasciicircum{}",
+    }
+)
+
+# Matches any \newcommand{\Name}{default}; replacement values are resolved
+# per match from a dict, so one scan substitutes every template variable.
+_NEWCOMMAND_RE = re.compile(r"\\newcommand\{\\([A-Za-z]+)\}\{[^}]*\}")
+
+# Template variables in {{var}} format
+_TEMPLATE_VAR_RE = re.compile(r"\{\{(\w+)\}\}")
+
+# All error shapes fused into one alternation so a failed compilation's log
+# is scanned once instead of once per pattern; the first matching alternative
+# classifies each "!" line, dispatched on which named group matched.
+# Inline (?m) flag instead of the flags argument so the patterns compile
+# identically under both engines.
+_LOG_ERROR_RE = _log_re.compile(
+    r"(?m)^(?:"
+    r"! LaTeX Error: File `(?P<missing>[^']+)' not found.*"
+    r"|! Undefined control sequence\.\s*l\.(?P<uline>\d+)\s+(?P<uctx>.+)?"
+    r"|! Package (?P<pkg>\w+) Error: (?P<pmsg>.+)"
+    r"|! (?P<err>.+)"
+    r")$"
+)
+_LOG_WARNING_RE = _log_re.compile(r"(?m)^(?:LaTeX Warning|Package \w+ Warning): (.+)$")
+
+
+@functools.lru_cache(maxsize=256)
 def snake_to_pascal(name: str) -> str:
     return "".join(part.capitalize() for part in name.split("_") if part)
 
 
+@functools.lru_cache(maxsize=256)
+def _latex_command_name(key: str) -> str:
+    """Map a snake_case variable key to its LaTeX command name (no underscores).
+
+    The set of variable keys is small and fixed per template, so after the
+    first render this is a pure cache lookup.
+    """
+    return key.replace("_", "")
+
+
 class LaTeXCompilationError(Exception):
     """Raised when LaTeX compilation fails with detailed error information."""
 
@@ -29,6 +95,41 @@ class LaTeXCompilationError(Exception):
 class DocumentService:
     """Service for handling document generation and PDF operations."""
 
+    # Preamble hash -> dumped .fmt path (None when the dump failed, so the
+    # failure isn't retried on every compilation).
+    _fmt_cache: ClassVar[dict[str, Path | None]] = {}
+    _fmt_lock: ClassVar[asyncio.Lock] = asyncio.Lock()
+
+    # pdflatex is CPU-bound and single-threaded per process; cap concurrent
+    # compilations at the core count so batches parallelize without thrashing.
+    _compile_semaphore: ClassVar[asyncio.Semaphore] = asyncio.Semaphore(os.cpu_count() or 1)
+
+    @classmethod
+    async def generate_pdfs_batch(cls, jobs: list[tuple[Path, Path, dict[str, str] | None]]) -> list[Path]:
+        """
+        Generate several PDFs concurrently, one pdflatex subprocess per document.
+
+        Each compilation runs in its own OS process, so independent documents
+        (e.g. cover letter + CV) genuinely run on separate cores; a semaphore
+        bounds concurrency at the core count.
+
+        Args:
+            jobs: Tuples of (tex_file, output_dir, variables) as accepted by
+                :meth:`generate_pdf_from_latex`
+
+        Returns:
+            Paths to the generated PDF files, in job order
+
+        Raises:
+            Same exceptions as :meth:`generate_pdf_from_latex`
+        """
+
+        async def bounded(tex_file: Path, output_dir: Path, variables: dict[str, str] | None) -> Path:
+            async with cls._compile_semaphore:
+                return await cls.generate_pdf_from_latex(tex_file, output_dir, variables)
+
+        return list(await asyncio.gather(*(bounded(*job) for job in jobs)))
+
     @staticmethod
     def replace_template_variables(content: str, variables: dict[str, str]) -> str:
         """
@@ -47,27 +148,25 @@ class DocumentService:
         Returns:
             Content with variables replaced
         """
-        for key, value in variables.items():
-            if not value:
-                continue
-
-            # Escape LaTeX special characters in the value
-            escaped_value = DocumentService._escape_latex(str(value))
-
-            # Convert snake_case to PascalCase (LaTeX command names cannot contain underscores)
-            latex_var_name = key.replace("_", "")
-
-            # Pattern to match: \newcommand{\VariableName}{anything}
-            pattern = r"(\\newcommand\{\\" + re.escape(latex_var_name) + r"\})\{[^}]*\}"
+        # LaTeX command names cannot contain underscores, so strip them from
+        # the snake_case keys; values are escaped once up front.
+        mapping = {
+            _latex_command_name(key): DocumentService._escape_latex(str(value))
+            for key, value in variables.items()
+            if value
+        }
+        if not mapping:
+            return content
 
-            # Replace with: \newcommand{\VariableName}{escaped_value}
-            content = re.sub(
-                pattern,
-                rf"\1{{{escaped_value}}}",
-                content,
-            )
+        def substitute(match: re.Match[str]) -> str:
+            value = mapping.get(match.group(1))
+            if value is None:
+                return match.group(0)
+            return rf"\newcommand{{\{match.group(1)}}}{{{value}}}"
 
-        return content
+        # One scan over the content replaces every variable via dict lookup,
+        # instead of one compiled pattern + full pass per variable.
+        return _NEWCOMMAND_RE.sub(substitute, content)
 
     @staticmethod
     def _escape_latex(text: str) -> str:
@@ -80,33 +179,7 @@ class DocumentService:
         Returns:
             Text with LaTeX special characters escaped
         """
-        # Use a temporary placeholder for backslashes to avoid double-escaping
-        # This placeholder is extremely unlikely to appear in real text
-
-        result = text
-        # Replace backslashes with placeholder first
-        result = result.replace("\\", BACKSLASH_PLACEHOLDER)
-
-        # Now escape other special characters
-        replacements = {
-            "&": r"\&",
-            "%": r"\%",
-            "$": r"\$",
-            "#": r"\#",
-            "_": r"\_",
-            "{": r"\{",
-            "}": r"\}",
-            "~": r"\textasciitilde{}",
-            "^": r"\textasciicircum{}",
-        }
-
-        for char, escaped in replacements.items():
-            result = result.replace(char, escaped)
-
-        # Finally, replace the placeholder with the escaped backslash
-        result = result.replace(BACKSLASH_PLACEHOLDER, r"\textbackslash{}")
-
-        return result
+        return text.translate(_LATEX_ESCAPE_TABLE)
 
     @staticmethod
     def extract_template_variables(content: str) -> list[str]:
@@ -121,9 +194,8 @@ class DocumentService:
         Returns:
             List of unique variable names found
         """
-        pattern = r"\{\{(\w+)\}\}"
-        matches = re.findall(pattern, content)
-        return list(set(matches))
+        # Stream matches straight into a set — no intermediate list of duplicates
+        return list({match.group(1) for match in _TEMPLATE_VAR_RE.finditer(content)})
 
     @staticmethod
     async def generate_pdf_from_latex(
@@ -149,38 +221,153 @@ class DocumentService:
         if not tex_file.exists():
             raise FileNotFoundError(f"LaTeX file not found: {tex_file}")
 
-        content = tex_file.read_text(encoding="utf-8")
+        original_content = tex_file.read_text(encoding="utf-8")
 
         # Always perform variable replacement if template has variables
         # This handles both populated variables and placeholder replacement
+        content = original_content
         if variables:
-            replaced_content = DocumentService.replace_template_variables(content, variables)
-
-            # Create temporary file with replaced content
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".tex", delete=False, dir=output_dir, encoding="utf-8"
-            ) as tmp_file:
-                tmp_file.write(replaced_content)
-                tmp_tex_path = Path(tmp_file.name)
+            content = DocumentService.replace_template_variables(original_content, variables)
+
+        final_pdf = output_dir / tex_file.with_suffix(".pdf").name
+        cache_file = DocumentService._cached_pdf_path(content)
+        if cache_file.exists():
+            # Identical source was compiled before: reuse the PDF and skip
+            # the multi-second pdflatex subprocess entirely.
+            shutil.copyfile(cache_file, final_pdf)
+            cache_file.touch()  # mark as recently used for LRU eviction
+            logger.info("Reusing cached PDF for %s", tex_file.name)
+            return final_pdf
+
+        if content != original_content:
+            # Substitution changed the source: compile from a scratch file.
+            # A plain uuid-named write avoids NamedTemporaryFile's mkstemp
+            # open/close dance.
+            tmp_tex_path = output_dir / f".{uuid4().hex}.tex"
+            tmp_tex_path.write_text(content, encoding="utf-8")
 
             try:
                 result_pdf = await DocumentService._compile_latex(tmp_tex_path, output_dir)
                 # Rename to original filename
-                final_pdf = output_dir / tex_file.with_suffix(".pdf").name
                 if result_pdf != final_pdf:
                     result_pdf.rename(final_pdf)
-                return final_pdf
             finally:
                 # Clean up temporary file
                 tmp_tex_path.unlink(missing_ok=True)
         else:
-            return await DocumentService._compile_latex(tex_file, output_dir)
+            # No variable touched the content (or none were given) — compile
+            # the original file in place with no temp-file round-trip
+            final_pdf = await DocumentService._compile_latex(tex_file, output_dir)
+
+        DocumentService._store_cached_pdf(final_pdf, cache_file)
+        return final_pdf
+
+    @staticmethod
+    def _cached_pdf_path(content: str) -> Path:
+        """Return the content-addressed cache location for a fully substituted source."""
+        key = hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+        return PDF_CACHE_DIR / f"{key}.pdf"
+
+    @staticmethod
+    def _store_cached_pdf(pdf_file: Path, cache_file: Path) -> None:
+        """Copy a freshly compiled PDF into the cache and evict the oldest entries."""
+        try:
+            PDF_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(pdf_file, cache_file)
+
+            entries = sorted(PDF_CACHE_DIR.glob("*.pdf"), key=lambda entry: entry.stat().st_mtime)
+            for stale in entries[: max(len(entries) - PDF_CACHE_MAX_ENTRIES, 0)]:
+                stale.unlink(missing_ok=True)
+        except OSError as e:
+            # The cache is an optimization; never let it break generation
+            logger.warning("Failed to update PDF cache: %s", e)
+
+    @classmethod
+    async def _get_preamble_format(cls, content: str) -> tuple[Path, str] | None:
+        """
+        Look up (or build) a dumped pdflatex format for the preamble of ``content``.
+
+        The preamble (everything before ``\\begin{document}``) is by far the most
+        expensive part of a pdflatex run and rarely changes between generations of
+        the same template. Dumping it once to a ``.fmt`` file lets subsequent runs
+        load the precompiled state instead of re-parsing the document class and
+        packages on every PDF.
+
+        Args:
+            content: Full LaTeX source
+
+        Returns:
+            Tuple of (format file path, document body starting at ``\\begin{document}``),
+            or None if the content has no preamble or the format dump failed.
+        """
+        split_at = content.find(BEGIN_DOCUMENT)
+        if split_at <= 0:
+            return None
+
+        preamble = content[:split_at]
+        digest = hashlib.blake2b(preamble.encode("utf-8"), digest_size=16).hexdigest()
+
+        async with cls._fmt_lock:
+            if digest not in cls._fmt_cache:
+                cls._fmt_cache[digest] = await cls._dump_preamble_format(preamble, digest)
+            fmt_file = cls._fmt_cache[digest]
+
+        if fmt_file is None:
+            return None
+        return fmt_file, content[split_at:]
+
+    @staticmethod
+    async def _dump_preamble_format(preamble: str, fmt_name: str) -> Path | None:
+        """
+        Dump a LaTeX preamble to a pdflatex ``.fmt`` file via iniTeX.
+
+        Args:
+            preamble: Preamble source (everything before ``\\begin{document}``)
+            fmt_name: Basename for the generated format file
+
+        Returns:
+            Path to the generated format file, or None if the dump failed
+        """
+        FMT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        preamble_file = FMT_CACHE_DIR / f"{fmt_name}.tex"
+        preamble_file.write_text(preamble + "\n\\dump\n", encoding="utf-8")
+
+        try:
+            result = await asyncio.create_subprocess_exec(
+                "pdflatex",
+                "-ini",
+                "-interaction=nonstopmode",
+                f"-output-directory={FMT_CACHE_DIR}",
+                f"-jobname={fmt_name}",
+                "&pdflatex",
+                str(preamble_file),
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            await result.wait()
+        except OSError as e:
+            # Let the plain compilation path surface the real error
+            logger.warning("Could not launch pdflatex for format dump: %s", e)
+            return None
+
+        fmt_file = FMT_CACHE_DIR / f"{fmt_name}.fmt"
+        if result.returncode != 0 or not fmt_file.exists():
+            logger.warning("Preamble format dump failed (exit code %s); compiling without it", result.returncode)
+            return None
+
+        logger.info("Dumped preamble format: %s", fmt_file)
+        return fmt_file
 
     @staticmethod
     async def _compile_latex(tex_file: Path, output_dir: Path) -> Path:
         """
         Generate PDF from LaTeX file with detailed error reporting.
 
+        The template preamble is precompiled to a cached ``.fmt`` format file so
+        repeated compilations of the same template only pay for the document body.
+        If the format dump or the format-based run fails, compilation falls back
+        to a plain pdflatex run of the full file.
+
         Args:
             tex_file: Path to the .tex file
             output_dir: Directory where PDF should be generated
@@ -198,22 +385,70 @@ class DocumentService:
 
         logger.info("Compiling LaTeX file: %s", tex_file)
 
-        result = await asyncio.create_subprocess_exec(
-            "pdflatex",
+        cached = await DocumentService._get_preamble_format(tex_file.read_text(encoding="utf-8"))
+        if cached is not None:
+            fmt_file, body = cached
+            body_file = output_dir / f"{tex_file.stem}.body.tex"
+            body_file.write_text(body, encoding="utf-8")
+            try:
+                return await DocumentService._run_pdflatex(
+                    body_file, output_dir, jobname=tex_file.stem, fmt_file=fmt_file
+                )
+            except LaTeXCompilationError:
+                # A stale or incompatible format must not break generation
+                logger.warning("Compilation with cached preamble format failed; retrying without it")
+            finally:
+                body_file.unlink(missing_ok=True)
+
+        return await DocumentService._run_pdflatex(tex_file, output_dir, jobname=tex_file.stem)
+
+    @staticmethod
+    async def _run_pdflatex(tex_file: Path, output_dir: Path, jobname: str, fmt_file: Path | None = None) -> Path:
+        """
+        Run pdflatex on a file and report errors from the compilation log.
+
+        Args:
+            tex_file: Path to the .tex file to compile
+            output_dir: Directory where PDF should be generated
+            jobname: Basename for the output artifacts (pdf, log, aux)
+            fmt_file: Optional precompiled preamble format to load
+
+        Returns:
+            Path to the generated PDF file
+
+        Raises:
+            LaTeXCompilationError: If pdflatex compilation fails
+            RuntimeError: If PDF file was not generated despite success
+        """
+        args = [
             "-interaction=nonstopmode",
             f"-output-directory={output_dir}",
+            f"-jobname={jobname}",
+        ]
+        if fmt_file is not None:
+            args.insert(0, f"-fmt={fmt_file}")
+
+        # The full transcript is only ever surfaced at DEBUG level; errors are
+        # diagnosed from the .log file. Skip piping/decoding the multi-MB
+        # stdout stream entirely unless someone is actually debugging.
+        capture_output = logger.isEnabledFor(logging.DEBUG)
+        pipe = asyncio.subprocess.PIPE if capture_output else asyncio.subprocess.DEVNULL
+
+        result = await asyncio.create_subprocess_exec(
+            "pdflatex",
+            *args,
             str(tex_file),
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
+            stdout=pipe,
+            stderr=pipe,
         )
 
         stdout, stderr = await result.communicate()
-        stdout_str = stdout.decode("utf-8", errors="replace")
-        stderr_str = stderr.decode("utf-8", errors="replace")
+        stdout_str = stdout.decode("utf-8", errors="replace") if stdout is not None else ""
+        stderr_str = stderr.decode("utf-8", errors="replace") if stderr is not None else ""
 
         # Expected output PDF file
-        pdf_file = output_dir / tex_file.with_suffix(".pdf").name
-        log_file = output_dir / tex_file.with_suffix(".log").name
+        pdf_file = output_dir / f"{jobname}.pdf"
+        log_file = output_dir / f"{jobname}.log"
 
         if result.returncode != 0:
             # Parse the log file for detailed error information
@@ -260,42 +495,32 @@ class DocumentService:
         Returns:
             List of error messages found in the log
         """
+        max_errors = 10  # Limit to avoid overwhelming output
         errors = []
 
-        # Pattern for classic LaTeX errors: ! Error message
-        error_pattern = re.compile(r"^! (.+)$", re.MULTILINE)
-        errors.extend(f"Error: {match.group(1).strip()}" for match in error_pattern.finditer(log_content))
-
-        # Pattern for missing packages: ! LaTeX Error: File `package.sty' not found
-        missing_file_pattern = re.compile(r"! LaTeX Error: File `([^']+)' not found", re.MULTILINE)
-        errors.extend(f"Missing file: {match.group(1)}" for match in missing_file_pattern.finditer(log_content))
-
-        # Pattern for undefined control sequences
-        undefined_pattern = re.compile(r"! Undefined control sequence\.\s*l\.(\d+)\s+(.+)?", re.MULTILINE)
-        for match in undefined_pattern.finditer(log_content):
-            line_num = match.group(1)
-            context = match.group(2).strip() if match.group(2) else "unknown command"
-            errors.append(f"Undefined control sequence at line {line_num}: {context}")
-
-        # Pattern for package errors
-        package_error_pattern = re.compile(r"! Package (\w+) Error: (.+)", re.MULTILINE)
-        for match in package_error_pattern.finditer(log_content):
-            package = match.group(1)
-            message = match.group(2).strip()
-            errors.append(f"Package {package} error: {message}")
-
-        # Pattern for emergency stops
-        if "! Emergency stop." in log_content:
-            errors.append("Emergency stop: Fatal error occurred during compilation")
+        # One scan over the log classifies every error line via named groups
+        for match in _LOG_ERROR_RE.finditer(log_content):
+            if match.group("missing") is not None:
+                errors.append(f"Missing file: {match.group('missing')}")
+            elif match.group("uline") is not None:
+                context = match.group("uctx").strip() if match.group("uctx") else "unknown command"
+                errors.append(f"Undefined control sequence at line {match.group('uline')}: {context}")
+            elif match.group("pkg") is not None:
+                errors.append(f"Package {match.group('pkg')} error: {match.group('pmsg').strip()}")
+            elif match.group("err") == "Emergency stop.":
+                errors.append("Emergency stop: Fatal error occurred during compilation")
+            else:
+                errors.append(f"Error: {match.group('err').strip()}")
+            if len(errors) >= max_errors:
+                return errors
 
         # If no specific errors found, look for warnings that might be critical
         if not errors:
-            warning_pattern = re.compile(r"^(?:LaTeX Warning|Package \w+ Warning): (.+)$", re.MULTILINE)
-            warnings = [match.group(1).strip() for match in warning_pattern.finditer(log_content)]
+            warnings = [match.group(1).strip() for match in _LOG_WARNING_RE.finditer(log_content)]
             if warnings:
                 errors.append(f"Warnings detected: {'; '.join(warnings[:3])}")
 
-        return errors[:10]  # Limit to first 10 errors to avoid overwhelming output
+        return errors
 
     @staticmethod
     def merge_pdfs(pdf_files: list[Path], output_file: Path) -> None:
@@ -312,12 +537,45 @@ class DocumentService:
         """
         logger.info("Merging %d PDF files into %s", len(pdf_files), output_file)
 
+        for pdf_file in pdf_files:
+            if not pdf_file.exists():
+                raise FileNotFoundError(f"PDF file not found: {pdf_file}")
+
+        try:
+            # Lazy import (pattern from llm.get_model): qpdf copies page
+            # objects without re-encoding content streams, making merges much
+            # faster and lighter than pypdf's full re-serialization
+            import pikepdf  # noqa: PLC0415
+        except ImportError:  # pragma: no cover - optional fast path
+            pikepdf = None  # type: ignore[assignment]
+
+        if pikepdf is not None:
+            try:
+                with ExitStack() as stack:
+                    # Source documents must stay open until save: the merged
+                    # document only references their page objects.
+                    merged = stack.enter_context(pikepdf.new())
+                    for pdf_file in pdf_files:
+                        logger.debug("Adding PDF to merge: %s", pdf_file)
+                        source = stack.enter_context(pikepdf.open(pdf_file))
+                        merged.pages.extend(source.pages)
+                    merged.save(str(output_file))
+                logger.info("Successfully merged PDFs into %s", output_file)
+                return
+            except Exception as e:
+                logger.warning("pikepdf merge failed (%s); falling back to pypdf", e)
+
+        DocumentService._merge_pdfs_pypdf(pdf_files, output_file)
+
+    @staticmethod
+    def _merge_pdfs_pypdf(pdf_files: list[Path], output_file: Path) -> None:
+        """Merge PDFs with pypdf; slower re-serializing fallback for when pikepdf is unavailable."""
+        from pypdf import PdfWriter  # noqa: PLC0415
+
         writer = PdfWriter()
 
         try:
             for pdf_file in pdf_files:
-                if not pdf_file.exists():
-                    raise FileNotFoundError(f"PDF file not found: {pdf_file}")
                 logger.debug("Adding PDF to merge: %s", pdf_file)
                 writer.append(str(pdf_file))
 
@@ -1,8 +1,8 @@
+import asyncio
 import logging
+from typing import TYPE_CHECKING
 
 import httpx
-import trafilatura
-from playwright.async_api import async_playwright
 from pydantic import BaseModel, Field
 from pydantic_ai import Agent, ModelSettings
 
@@ -10,6 +10,9 @@ from applique_backend.db.models import LLMConfiguration
 from applique_backend.services.llm import get_model
 from applique_backend.services.prompts.manager import PromptManager, PromptTemplate
 
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, Playwright
+
 logger = logging.getLogger(__name__)
 
 
@@ -47,44 +50,107 @@ async def _fetch_with_httpx(url: str) -> str:
         return resp.text
 
 
+# Process-lifetime Playwright/browser singletons: launching chromium costs
+# seconds per call, while a fresh context on a running browser costs ~ms.
+_playwright: "Playwright | None" = None
+_browser: "Browser | None" = None
+_browser_lock = asyncio.Lock()
+
+
+async def _get_browser() -> "Browser":
+    """Return the shared headless browser, launching it on first use."""
+    # Imported lazily so workers that never hit the Playwright fallback don't
+    # pay its import cost at startup (same pattern as llm.get_model)
+    from playwright.async_api import async_playwright  # noqa: PLC0415
+
+    global _playwright, _browser  # noqa: PLW0603
+    async with _browser_lock:
+        if _browser is None or not _browser.is_connected():
+            if _playwright is None:
+                _playwright = await async_playwright().start()
+            _browser = await _playwright.chromium.launch(headless=True)
+            logger.info("Launched shared headless browser")
+    return _browser
+
+
+async def shutdown_browser() -> None:
+    """Close the shared browser and Playwright driver; called on application shutdown."""
+    global _playwright, _browser  # noqa: PLW0603
+    async with _browser_lock:
+        if _browser is not None:
+            await _browser.close()
+            _browser = None
+        if _playwright is not None:
+            await _playwright.stop()
+            _playwright = None
+
+
 async def _fetch_with_playwright(url: str) -> str:
     """Fetch content using Playwright (for JavaScript-heavy sites)."""
     logger.info("Attempting to fetch %s with Playwright...", url)
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        context = await browser.new_context(
-            user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
-            viewport={"width": 1920, "height": 1080},
+    browser = await _get_browser()
+    # Contexts are cheap and isolate cookies/storage per fetch; only the
+    # browser process itself is reused across calls.
+    context = await browser.new_context(
+        user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+        viewport={"width": 1920, "height": 1080},
+    )
+    try:
+        # Images, fonts and media never contribute to the extracted text;
+        # dropping them saves bandwidth and render time
+        await context.route(
+            "**/*.{png,jpg,jpeg,gif,svg,webp,ico,woff,woff2,ttf,otf,mp4,webm}",
+            lambda route: route.abort(),
         )
+        page = await context.new_page()
+
+        # networkidle blocks on trackers and polling XHRs that may never
+        # quiesce; DOMContentLoaded plus a short wait for the content
+        # container is enough for the text we extract
+        await page.goto(url, wait_until="domcontentloaded", timeout=15000)
         try:
-            page = await context.new_page()
+            await page.wait_for_selector("main, article, [class*=job]", timeout=3000)
+        except Exception:
+            logger.debug("No content container appeared for %s; using DOM as-is", url)
 
-            # Set reasonable timeout and wait for network to be idle
-            await page.goto(url, wait_until="networkidle", timeout=30000)
+        # Get the fully rendered HTML
+        content = await page.content()
+        logger.info("Successfully fetched %s with Playwright (%d chars)", url, len(content))
+        return content
+    finally:
+        await context.close()
 
-            # Give any lazy-loaded content a moment to appear
-            await page.wait_for_timeout(1000)
 
-            # Get the fully rendered HTML
-            content = await page.content()
-            logger.info("Successfully fetched %s with Playwright (%d chars)", url, len(content))
-            return content
-        finally:
-            await context.close()
-            await browser.close()
+# Pages beyond this size are pathological (endless feeds, inlined data);
+# job postings fit comfortably and parsing cost grows with input size.
+_MAX_HTML_BYTES = 1_000_000
 
 
 def _extract_clean_content(html: str, url: str) -> str | None:
     """Extract clean, LLM-friendly content from HTML using Trafilatura."""
+    # Lazy import: trafilatura pulls in lxml and friends, which only extraction
+    # workloads need; after the first call this is a cached sys.modules lookup
+    import lxml.html  # noqa: PLC0415
+    import trafilatura  # noqa: PLC0415
+
     try:
+        # Parse once with lxml and hand trafilatura the tree, skipping its
+        # internal re-parse of the raw HTML string
+        tree = lxml.html.fromstring(html[:_MAX_HTML_BYTES])
         clean_text = trafilatura.extract(
-            html,
+            tree,
             include_comments=False,
             include_tables=True,  # Keep job requirement tables
             no_fallback=False,  # Use fallback extraction if needed
             favor_precision=False,  # Prefer recall over precision (get more content)
             output_format="markdown",  # LLM-friendly format
             url=url,  # Helps with link resolution
+            # The LLM only needs the text: skip the link/image/metadata and
+            # deduplication scans entirely
+            include_links=False,
+            include_images=False,
+            with_metadata=False,
+            deduplicate=False,
         )
 
         if clean_text and len(clean_text) > 100:  # noqa: PLR2004
@@ -1,12 +1,22 @@
+import hashlib
+import json
 import logging
+import os
+import tempfile
+from collections import OrderedDict
 from enum import StrEnum
 from pathlib import Path
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import DictLoader, Environment, FileSystemBytecodeCache, FileSystemLoader, Template, TemplateError
 
 logger = logging.getLogger(__name__)
 
+RENDER_CACHE_SIZE = 64
+
+# Digest of an empty render context, hashed once instead of per call
+_EMPTY_CONTEXT_DIGEST: bytes = hashlib.blake2b(b"{}", digest_size=16).digest()
+
 
 class PromptTemplate(StrEnum):
     """Enumeration of prompt templates."""
@@ -15,6 +25,12 @@ class PromptTemplate(StrEnum):
     CHAT_INSTRUCTIONS = "chat_instructions.txt.jinja"
 
 
+# Iterating a StrEnum goes through EnumMeta.__iter__ each time; the members
+# are fixed, so loops and filename checks use these precomputed views.
+_ALL_TEMPLATES: tuple[PromptTemplate, ...] = tuple(PromptTemplate)
+_ALL_TEMPLATE_VALUES: frozenset[str] = frozenset(template.value for template in _ALL_TEMPLATES)
+
+
 class PromptManager:
     """Manages prompt templates with two-tier lookup (user templates > defaults)."""
 
@@ -35,29 +51,138 @@ class PromptManager:
 
         self.enable_hot_reload = enable_hot_reload
 
-        # Create Jinja environment with multi-directory loader
-        # Priority: user templates > default templates
-        search_paths = []
-        if self.user_templates_dir:
-            search_paths.append(self.user_templates_dir)
-        search_paths.append(self.default_templates_dir)
+        # Validate that all default templates exist
+        self._validate_default_templates()
+
+        # Default templates ship with the app and never change at runtime, so
+        # their content is read and decoded exactly once.
+        self._default_content_cache: dict[PromptTemplate, str] = {
+            template: (self.default_templates_dir / template.value).read_text(encoding="utf-8")
+            for template in _ALL_TEMPLATES
+        }
+        # User template content cached by mtime so unchanged files aren't
+        # re-read on every request.
+        self._user_content_cache: dict[PromptTemplate, tuple[int, str]] = {}
+
+        # Per-template paths joined once; rebuilding dir / name on every call
+        # allocates a fresh PurePath each time for an invariant result.
+        self._default_paths: dict[PromptTemplate, Path] = {
+            template: self.default_templates_dir / template.value for template in _ALL_TEMPLATES
+        }
+        self._user_paths: dict[PromptTemplate, Path] = (
+            {template: self.user_templates_dir / template.value for template in _ALL_TEMPLATES}
+            if self.user_templates_dir
+            else {}
+        )
+
+        # Which templates have user overrides, from one directory scan instead
+        # of a stat syscall per lookup; kept current by save/delete.
+        self._user_customized: set[PromptTemplate] = self._scan_user_dir()
+
+        # Active template sources (user override where present, else default).
+        # Outside hot-reload mode the environment loads from this dict, so
+        # rendering never touches the filesystem; save/delete mutate it.
+        # Sources are stripped once here, making the edge-whitespace strip on
+        # every rendered result a constant-time no-op instead of an O(n) pass.
+        self._sources: dict[str, str] = {
+            template.value: self._default_content_cache[template].strip() for template in _ALL_TEMPLATES
+        }
+        for template in self._user_customized:
+            user_content = self.get_user_template_content(template)
+            if user_content is not None:
+                self._sources[template.value] = user_content.strip()
+
+        # Persist compiled template bytecode across process restarts so
+        # reloaded workers deserialize code objects instead of re-parsing
+        bytecode_cache_dir = Path(tempfile.gettempdir()) / "applique-jinja-bytecode"
+        bytecode_cache_dir.mkdir(parents=True, exist_ok=True)
+
+        if enable_hot_reload:
+            # Dev mode keeps the filesystem loader so auto_reload can pick up
+            # on-disk edits. Priority: user templates > default templates.
+            search_paths = []
+            if self.user_templates_dir:
+                search_paths.append(self.user_templates_dir)
+            search_paths.append(self.default_templates_dir)
+            loader: DictLoader | FileSystemLoader = FileSystemLoader(search_paths)
+        else:
+            loader = DictLoader(self._sources)
 
         self.env = Environment(
-            loader=FileSystemLoader(search_paths),
+            loader=loader,
             autoescape=False,  # noqa: S701
             auto_reload=enable_hot_reload,
+            bytecode_cache=FileSystemBytecodeCache(directory=str(bytecode_cache_dir)),
         )
 
-        # Validate that all default templates exist
-        self._validate_default_templates()
+        # Rendered prompts memoized by (template, force_default, context digest).
+        # Chat turns in a session typically repeat the exact same context, so
+        # re-rendering the large instruction template is wasted work.
+        self._render_cache: OrderedDict[tuple[str, bool, bytes], str] = OrderedDict()
+
+        # Bumped whenever a user template is saved or deleted, letting callers
+        # cache derived state (e.g. customization listings) until it changes.
+        self.customization_version: int = 0
+
+        # Templates precompiled at construction so render_prompt is a plain
+        # dict lookup — no per-render environment cache check or stat calls.
+        # Defaults are compiled from the already-read content.
+        self._compiled_default: dict[PromptTemplate, Template] = {
+            template: self.env.from_string(content.strip()) for template, content in self._default_content_cache.items()
+        }
+        self._compiled: dict[PromptTemplate, tuple[Template, str]] = {}
+        self._compile_templates()
+
+    def _scan_user_dir(self) -> set[PromptTemplate]:
+        """Scan the user templates directory once and return the customized templates.
+
+        os.scandir reads the directory entries without a stat per file, so this
+        is a single syscall burst rather than one exists() check per template.
+        """
+        if not self.user_templates_dir or not self.user_templates_dir.is_dir():
+            return set()
+
+        with os.scandir(self.user_templates_dir) as entries:
+            names = {
+                entry.name
+                for entry in entries
+                if entry.name in _ALL_TEMPLATE_VALUES and entry.is_file(follow_symlinks=False)
+            }
+        return {template for template in _ALL_TEMPLATES if template.value in names}
+
+    def _compile_templates(self) -> None:
+        """(Re)compile the active template for each prompt, noting its source.
+
+        Called at construction and whenever a user template is saved or
+        deleted, so renders never pay the lookup/compile cost themselves.
+
+        A user override that fails to compile (e.g. a file edited directly in
+        the user dir) must not prevent startup: it is logged, ignored, and the
+        shipped default is used instead.
+        """
+        if self.env.cache is not None:
+            self.env.cache.clear()
+        for template in _ALL_TEMPLATES:
+            _, is_user = self.get_template_path(template)
+            try:
+                compiled = self.env.get_template(template.value)
+            except TemplateError as e:
+                logger.error("Failed to compile user template '%s', falling back to default: %s", template.value, e)
+                self._user_customized.discard(template)
+                self._sources[template.value] = self._default_content_cache[template].strip()
+                self._compiled[template] = (self._compiled_default[template], "default")
+                continue
+            self._compiled[template] = (compiled, "user" if is_user else "default")
 
     def _validate_default_templates(self) -> None:
         """Validate that all default templates exist."""
-        missing_templates = []
-        for template_name in PromptTemplate:
-            template_path = self.default_templates_dir / template_name.value
-            if not template_path.exists():
-                missing_templates.append(template_name.value)
+        # One scandir over the directory instead of an exists() stat per template
+        try:
+            with os.scandir(self.default_templates_dir) as entries:
+                existing = {entry.name for entry in entries if entry.is_file(follow_symlinks=False)}
+        except FileNotFoundError:
+            existing = set()
+        missing_templates = [template.value for template in _ALL_TEMPLATES if template.value not in existing]
 
         if missing_templates:
             raise FileNotFoundError(
@@ -77,32 +202,52 @@ class PromptManager:
         Returns:
             str: Rendered prompt string
         """
-        template_name = prompt_template.value
+        # StrEnum members ARE their string value; using the member directly
+        # skips the DynamicClassAttribute descriptor behind .value
+        template_name: str = prompt_template
+
+        # With hot reload disabled, templates are stable, so identical inputs can
+        # be served from the render cache.
+        cache_key: tuple[str, bool, bytes] | None = None
+        if not self.enable_hot_reload:
+            if not context:
+                # Empty-context renders (e.g. the extraction system prompt) are
+                # the common case; skip the serialize + hash round-trip for them
+                context_digest = _EMPTY_CONTEXT_DIGEST
+            else:
+                context_digest = hashlib.blake2b(
+                    json.dumps(context, sort_keys=True, default=str).encode(), digest_size=16
+                ).digest()
+            cache_key = (template_name, force_default, context_digest)
+            cached = self._render_cache.get(cache_key)
+            if cached is not None:
+                self._render_cache.move_to_end(cache_key)
+                return cached
 
         # Determine which template to use
         if force_default:
-            # Force default template
+            # Force default template (precompiled from the shipped content)
             template_source = "default"
-            template = self.env.get_template(f"__default__/{template_name}")
-        else:
-            # Check if user template exists
-            user_template_exists = (
-                self.user_templates_dir is not None and (self.user_templates_dir / template_name).exists()
-            )
-
-            if user_template_exists:
-                template_source = "user"
-                logger.debug("Using user-customized template: %s", template_name)
-            else:
-                template_source = "default"
-                logger.debug("Using default template: %s", template_name)
-
+            template = self._compiled_default[prompt_template]
+        elif self.enable_hot_reload:
+            # Per-render lookup; auto_reload stats the file and recompiles on change
+            template_source = "user" if self.is_customized(prompt_template) else "default"
             template = self.env.get_template(template_name)
+        else:
+            # Precompiled at construction/save time — plain dict lookup
+            template, template_source = self._compiled[prompt_template]
 
         # Render template
         try:
+            # Sources are pre-stripped, so this strip returns the rendered
+            # string unchanged unless a block emitted edge whitespace (or the
+            # dev filesystem loader served a raw file)
             rendered = template.render(context or {}).strip()
             logger.debug("Successfully rendered template '%s' from %s source", template_name, template_source)
+            if cache_key is not None:
+                self._render_cache[cache_key] = rendered
+                if len(self._render_cache) > RENDER_CACHE_SIZE:
+                    self._render_cache.popitem(last=False)
             return rendered
         except Exception as e:
             logger.error("Failed to render template '%s' from %s: %s", template_name, template_source, e)
@@ -117,17 +262,32 @@ class PromptManager:
         Returns:
             Tuple of (template_path, is_user_customized)
         """
-        template_name = prompt_template.value
+        if self.enable_hot_reload:
+            # Dev mode: templates can appear/disappear outside the API, so
+            # refresh the customization set (still one scandir, not per-file stats)
+            self._user_customized = self._scan_user_dir()
 
         # Check user template first
-        if self.user_templates_dir:
-            user_path = self.user_templates_dir / template_name
-            if user_path.exists():
-                return user_path, True
+        if prompt_template in self._user_customized:
+            return self._user_paths[prompt_template], True
 
         # Fall back to default
-        default_path = self.default_templates_dir / template_name
-        return default_path, False
+        return self._default_paths[prompt_template], False
+
+    def list_customized(self) -> set[PromptTemplate]:
+        """Get all user-customized templates in one go.
+
+        Callers listing every template should prefer this over N calls to
+        is_customized: it answers from the cached customization set (refreshed
+        with a single directory scan in hot-reload mode) instead of a per-template
+        lookup.
+
+        Returns:
+            set[PromptTemplate]: Templates with a user override
+        """
+        if self.enable_hot_reload:
+            self._user_customized = self._scan_user_dir()
+        return set(self._user_customized)
 
     def is_customized(self, prompt_template: PromptTemplate) -> bool:
         """Check if a template has been customized by the user.
@@ -150,8 +310,7 @@ class PromptManager:
         Returns:
             str: Default template content
         """
-        default_path = self.default_templates_dir / prompt_template.value
-        return default_path.read_text(encoding="utf-8")
+        return self._default_content_cache[prompt_template]
 
     def get_user_template_content(self, prompt_template: PromptTemplate) -> str | None:
         """Get the user template content if it exists.
@@ -165,11 +324,20 @@ class PromptManager:
         if not self.user_templates_dir:
             return None
 
-        user_path = self.user_templates_dir / prompt_template.value
-        if user_path.exists():
-            return user_path.read_text(encoding="utf-8")
+        user_path = self._user_paths[prompt_template]
+        try:
+            mtime_ns = user_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._user_content_cache.pop(prompt_template, None)
+            return None
+
+        cached = self._user_content_cache.get(prompt_template)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
 
-        return None
+        content = user_path.read_text(encoding="utf-8")
+        self._user_content_cache[prompt_template] = (mtime_ns, content)
+        return content
 
     def save_user_template(self, prompt_template: PromptTemplate, content: str) -> Path:
         """Save a user-customized template.
@@ -187,9 +355,14 @@ class PromptManager:
         if not self.user_templates_dir:
             raise ValueError("User prompts directory is not configured")
 
-        self.user_templates_dir.mkdir(parents=True, exist_ok=True)
-        user_path = self.user_templates_dir / prompt_template.value
+        # __init__ already created the directory; no need to re-mkdir per save
+        user_path = self._user_paths[prompt_template]
         user_path.write_text(content, encoding="utf-8")
+        self._render_cache.clear()
+        self._user_customized.add(prompt_template)
+        self._sources[prompt_template.value] = content.strip()
+        self._compile_templates()
+        self.customization_version += 1
         logger.info("Saved user template: %s", user_path)
 
         return user_path
@@ -206,9 +379,14 @@ class PromptManager:
         if not self.user_templates_dir:
             return False
 
-        user_path = self.user_templates_dir / prompt_template.value
+        user_path = self._user_paths[prompt_template]
         if user_path.exists():
             user_path.unlink()
+            self._render_cache.clear()
+            self._user_customized.discard(prompt_template)
+            self._sources[prompt_template.value] = self._default_content_cache[prompt_template].strip()
+            self._compile_templates()
+            self.customization_version += 1
             logger.info("Deleted user template: %s (reverted to default)", user_path)
             return True
 
@@ -7,6 +7,7 @@ from fastapi.testclient import TestClient
 
 from applique_backend.app import build_app
 from applique_backend.core.settings import Settings
+from applique_backend.services.prompts.manager import PromptManager
 
 
 @pytest.fixture(scope="session")
@@ -15,6 +16,12 @@ def settings() -> Generator[Settings]:
         yield Settings()
 
 
+@pytest.fixture(scope="session")
+def prompt_manager(tmp_path_factory: pytest.TempPathFactory) -> PromptManager:
+    """Returns a shared PromptManager so template validation and compilation run once per session."""
+    return PromptManager(user_prompts_dir=tmp_path_factory.mktemp("prompts"))
+
+
 @pytest.fixture(scope="session")
 def client(settings: Settings) -> Generator[TestClient]:
     """Returns a test client for endpoint checks."""
@@ -0,0 +1,34 @@
+"""Tests for the prompt template manager."""
+
+from applique_backend.services.prompts.manager import PromptManager, PromptTemplate
+
+
+class TestPromptRendering:
+    """Test prompt template rendering."""
+
+    def test_render_default_template(self, prompt_manager: PromptManager):
+        """Test that default templates render to non-empty, stripped output."""
+        rendered = prompt_manager.render_prompt(PromptTemplate.JOB_INFORMATION_EXTRACTION)
+        assert rendered
+        assert rendered == rendered.strip()
+
+    def test_render_matches_forced_default(self, prompt_manager: PromptManager):
+        """Test that without a user override, force_default renders the same output."""
+        rendered = prompt_manager.render_prompt(PromptTemplate.CHAT_INSTRUCTIONS)
+        forced = prompt_manager.render_prompt(PromptTemplate.CHAT_INSTRUCTIONS, force_default=True)
+        assert rendered == forced
+
+    def test_repeated_render_is_cached(self, prompt_manager: PromptManager):
+        """Test that identical renders are served from the render cache."""
+        first = prompt_manager.render_prompt(PromptTemplate.CHAT_INSTRUCTIONS)
+        second = prompt_manager.render_prompt(PromptTemplate.CHAT_INSTRUCTIONS)
+        assert first is second
+
+
+class TestCustomizationStatus:
+    """Test user customization lookups."""
+
+    def test_no_customizations_by_default(self, prompt_manager: PromptManager):
+        """Test that a fresh user directory reports no customized templates."""
+        assert prompt_manager.list_customized() == set()
+        assert not prompt_manager.is_customized(PromptTemplate.JOB_INFORMATION_EXTRACTION)